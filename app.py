@@ -7,36 +7,60 @@ including the web interface, MCP server, and background document processing.
 """
 import argparse
 import asyncio
+import atexit
+import functools
 import logging
+import logging.handlers
+import os
+import signal
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # Import our components
 from llama_political_manager.config_manager import ConfigurationManager
 from llama_political_manager.mcp_server import PoliticalDocumentMCPServer
 from llama_political_manager.web_interface import WebInterface
 
-def setup_logging(log_level: str = "INFO"):
-    """Setup application logging."""
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('app.log')
-        ]
-    )
+logger = logging.getLogger(__name__)
 
-def create_sample_data(data_dir: Path):
-    """Create sample political documents for testing."""
-    data_dir.mkdir(exist_ok=True)
-    
-    # Sample political documents
-    samples = [
-        {
-            "filename": "healthcare_reform_2024.txt",
-            "content": """
+def setup_logging(log_level: str = "INFO") -> logging.Handler:
+    """Setup application logging.
+
+    Console output is written immediately. File output is buffered through a
+    ``MemoryHandler`` so records reach ``app.log`` in batches rather than one
+    ``write()`` per record; the buffer is flushed when full, on ERROR records
+    and at interpreter exit. In DEBUG mode the file handler is used directly so
+    every record is visible as soon as it is emitted.
+    """
+    level = getattr(logging, log_level.upper())
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    file_handler = logging.FileHandler('app.log', mode='a', encoding='utf-8', delay=True)
+    file_handler.setFormatter(formatter)
+
+    if level <= logging.DEBUG:
+        file_output: logging.Handler = file_handler
+    else:
+        file_output = logging.handlers.MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        atexit.register(file_output.flush)
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+
+    logging.basicConfig(level=level, handlers=[console_handler, file_output])
+    return file_output
+
+# Sample political documents written by ``--create-sample-data``
+_SAMPLE_DOCUMENTS = [
+    {
+        "filename": "healthcare_reform_2024.txt",
+        "content": """
 Healthcare Reform Act of 2024
 
 This comprehensive healthcare reform legislation aims to:
@@ -55,11 +79,11 @@ Key provisions include:
 
 This bill represents a significant step toward ensuring healthcare
 is a right, not a privilege, for every American.
-            """
-        },
-        {
-            "filename": "climate_action_plan.txt", 
-            "content": """
+        """
+    },
+    {
+        "filename": "climate_action_plan.txt", 
+        "content": """
 National Climate Action Plan
 
 Executive Summary:
@@ -83,11 +107,11 @@ Investment Priorities:
 
 This plan positions America as a global leader in the fight
 against climate change while creating economic opportunities.
-            """
-        },
-        {
-            "filename": "economic_recovery_bill.txt",
-            "content": """
+        """
+    },
+    {
+        "filename": "economic_recovery_bill.txt",
+        "content": """
 American Economic Recovery and Resilience Act
 
 Purpose:
@@ -116,15 +140,46 @@ Economic Impact:
 
 This legislation represents the largest public investment
 in the American economy since the New Deal.
-            """
-        }
-    ]
+        """
+    }
+]
+
+# Stripped and UTF-8 encoded once at import so writing them is pure I/O
+_SAMPLES: Tuple[Tuple[str, bytes], ...] = tuple(
+    (sample["filename"], sample["content"].strip().encode("utf-8"))
+    for sample in _SAMPLE_DOCUMENTS
+)
+
+def _write_many(files: Iterable[Tuple[Path, bytes]]) -> None:
+    """Write several small files with raw ``os.write`` calls.
+    
+    Avoids the text/buffered io layers, so each file costs exactly one open,
+    one write (barring short writes) and one close.
+    """
+    # O_BINARY (Windows only) keeps the CRT from translating newlines
+    flags = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+             | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0))
+    for path, blob in files:
+        fd = os.open(path, flags, 0o644)
+        try:
+            view = memoryview(blob)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+def create_sample_data(data_dir: Path):
+    """Create sample political documents for testing."""
+    # main() has usually created the directory already; unlike
+    # mkdir(exist_ok=True) this does not stat it again when it exists.
+    try:
+        os.mkdir(data_dir)
+    except FileExistsError:
+        pass
     
-    for sample in samples:
-        doc_path = data_dir / sample["filename"]
-        doc_path.write_text(sample["content"].strip())
+    _write_many((data_dir / filename, blob) for filename, blob in _SAMPLES)
     
-    print(f"Created {len(samples)} sample documents in {data_dir}")
+    print(f"Created {len(_SAMPLES)} sample documents in {data_dir}")
 
 async def start_mcp_server(config_manager: ConfigurationManager, 
                           host: str = "localhost", port: int = 8080):
@@ -133,15 +188,46 @@ async def start_mcp_server(config_manager: ConfigurationManager,
     await mcp_server.start(host, port)
     return mcp_server
 
+# WebInterface built for each config manager, see _get_web_interface()
+_web_interfaces: Dict[ConfigurationManager, WebInterface] = {}
+
+def _get_web_interface(config_manager: ConfigurationManager) -> WebInterface:
+    """Return the WebInterface (and its routes) built for a config manager.
+    
+    Host, port and debug only matter to ``run()``, so the app is shared by
+    every start of the same configuration.
+    """
+    web_app = _web_interfaces.get(config_manager)
+    if web_app is None:
+        web_app = _web_interfaces[config_manager] = WebInterface(config_manager=config_manager)
+    return web_app
+
 def start_web_interface(config_manager: ConfigurationManager,
                        host: str = "localhost", port: int = 8000, debug: bool = False):
     """Start the web interface."""
-    web_app = WebInterface(config_manager=config_manager)
+    web_app = _get_web_interface(config_manager)
     web_app.run(host, port, debug)
     return web_app
 
-def main():
-    """Main application entry point."""
+# Arguments for the common no-flag invocation. The parser is only built when
+# there is something to parse; keep these in sync with its defaults.
+_DEFAULT_ARGS = argparse.Namespace(
+    config_dir="./config",
+    data_dir="./data",
+    log_level="INFO",
+    create_sample_data=False,
+    web_host="localhost",
+    web_port=8000,
+    mcp_host="localhost",
+    mcp_port=8080,
+    web_only=False,
+    mcp_only=False,
+    debug=False
+)
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
     parser = argparse.ArgumentParser(description="LlamaIndex Political Document Manager")
     parser.add_argument("--config-dir", type=str, default="./config",
                        help="Configuration directory (default: ./config)")
@@ -166,17 +252,29 @@ def main():
                        help="Start only the MCP server")
     parser.add_argument("--debug", action="store_true",
                        help="Enable debug mode")
-    
-    args = parser.parse_args()
+    return parser
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments, skipping argparse when there are none."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        return argparse.Namespace(**vars(_DEFAULT_ARGS))
+    return _build_parser().parse_args(argv)
+
+def main():
+    """Main application entry point."""
+    args = parse_args()
     
     # Setup logging
     setup_logging(args.log_level)
-    logger = logging.getLogger(__name__)
     
-    # Create directories
+    # The default SIGTERM action skips atexit hooks and would drop buffered
+    # log records, so turn it into a normal interpreter exit.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
+    # Create directories (ConfigurationManager creates config_dir itself)
     config_dir = Path(args.config_dir)
     data_dir = Path(args.data_dir)
-    config_dir.mkdir(exist_ok=True)
     data_dir.mkdir(exist_ok=True)
     
     # Create sample data if requested
@@ -196,63 +294,79 @@ def main():
     config_manager.update_config("deployment", deployment_updates)
     
     logger.info("Starting LlamaIndex Political Document Manager")
-    logger.info(f"Configuration directory: {config_dir}")
-    logger.info(f"Data directory: {data_dir}")
+    logger.info("Configuration directory: %s", config_dir)
+    logger.info("Data directory: %s", data_dir)
+    
+    async def run_mcp():
+        """Run the MCP server until it is stopped."""
+        logger.info("Starting MCP server on %s:%d", args.mcp_host, args.mcp_port)
+        mcp_server = await start_mcp_server(config_manager, args.mcp_host, args.mcp_port)
+        try:
+            await mcp_server.wait_stopped()
+        finally:
+            if mcp_server.is_running:
+                await mcp_server.stop()
+    
+    async def run_web():
+        """Run the web interface until it is cancelled."""
+        logger.info("Starting web interface on %s:%d", args.web_host, args.web_port)
+        start_web_interface(config_manager, args.web_host, args.web_port, args.debug)
+        
+        # In a real implementation, this would be an async web server
+        logger.info("Web interface is running (mock implementation)")
+        await asyncio.get_running_loop().create_future()
     
     async def run_application():
         """Run the complete application."""
-        tasks = []
+        services = []
         
         if not args.web_only:
-            # Start MCP server
-            logger.info(f"Starting MCP server on {args.mcp_host}:{args.mcp_port}")
-            mcp_server = await start_mcp_server(config_manager, args.mcp_host, args.mcp_port)
-            
-            # Keep MCP server running
-            async def keep_mcp_running():
-                while mcp_server.is_running:
-                    await asyncio.sleep(1)
-            
-            tasks.append(keep_mcp_running())
-        
+            services.append(run_mcp())
         if not args.mcp_only:
-            # Start web interface
-            logger.info(f"Starting web interface on {args.web_host}:{args.web_port}")
-            web_app = start_web_interface(config_manager, args.web_host, args.web_port, args.debug)
-            
-            # In a real implementation, this would be an async web server
-            async def keep_web_running():
-                logger.info("Web interface is running (mock implementation)")
-                while True:
-                    await asyncio.sleep(10)
-                    logger.debug("Web interface heartbeat")
-            
-            tasks.append(keep_web_running())
+            services.append(run_web())
         
-        if tasks:
-            # Run all tasks concurrently
-            await asyncio.gather(*tasks)
-        else:
+        if not services:
             logger.error("No services selected to run")
+            return
+        
+        # Each task lives exactly as long as its service. If one fails the
+        # others are cancelled rather than left running, and cancelling
+        # run_application (e.g. on Ctrl+C) tears down every service.
+        tasks = [asyncio.ensure_future(service) for service in services]
+        try:
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        for task in done:
+            task.result()
     
     try:
         if args.web_only and not args.mcp_only:
             # Synchronous web interface only
             web_app = start_web_interface(config_manager, args.web_host, args.web_port, args.debug)
             logger.info("Web interface started (press Ctrl+C to stop)")
+            stop = threading.Event()
+            signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+            if os.name != "nt":
+                # On Windows Ctrl+C is left to raise KeyboardInterrupt between the waits below
+                signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
             try:
-                while True:
-                    import time
-                    time.sleep(1)
+                # Wait in short slices: a bare wait() cannot be interrupted on Windows
+                while not stop.wait(0.5):
+                    pass
             except KeyboardInterrupt:
-                logger.info("Shutting down web interface")
+                pass
+            logger.info("Shutting down web interface")
         else:
             # Run async services
             asyncio.run(run_application())
     except KeyboardInterrupt:
         logger.info("Application interrupted by user")
     except Exception as e:
-        logger.error(f"Application error: {e}")
+        logger.error("Application error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
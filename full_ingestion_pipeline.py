@@ -4,43 +4,45 @@ Full Ingestion Pipeline Script for Political Document Analysis System
 This script provides a complete ingestion pipeline when all dependencies are available.
 """
 
+import argparse
 import asyncio
+import importlib.util
+import io
 import json
 import os
-import sys
+import tarfile
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
-# Add the current directory to Python path
-sys.path.append(str(Path(__file__).parent))
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding/decoding
+    orjson = None
+
+# Module probed for each optional dependency
+DEPENDENCY_MODULES = {
+    "llama_index": "llama_index.core",
+    "llama_index_web_readers": "llama_index.readers.web",
+    "dotenv": "dotenv",
+}
+
+def _module_available(name: str) -> bool:
+    """Check whether a module can be imported without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        # Raised when a parent package of a dotted name is missing
+        return False
+
+@lru_cache(maxsize=1)
+def _probe_dependencies() -> Dict[str, bool]:
+    return {key: _module_available(module) for key, module in DEPENDENCY_MODULES.items()}
 
 def check_dependencies():
     """Check if all required dependencies are available"""
-    dependencies = {
-        "llama_index": False,
-        "llama_index_web_readers": False,
-        "dotenv": False
-    }
-    
-    try:
-        import llama_index.core
-        dependencies["llama_index"] = True
-    except ImportError:
-        pass
-    
-    try:
-        import llama_index.readers.web
-        dependencies["llama_index_web_readers"] = True
-    except ImportError:
-        pass
-    
-    try:
-        import dotenv
-        dependencies["dotenv"] = True
-    except ImportError:
-        pass
-    
-    return dependencies
+    return dict(_probe_dependencies())
 
 def load_sources_from_config(config_file: str = None) -> Dict[str, Any]:
     """
@@ -73,12 +75,141 @@ def load_sources_from_config(config_file: str = None) -> Dict[str, Any]:
             ]
         }
 
-async def run_full_ingestion_pipeline(config_file: str = None):
+OUTPUT_FORMATS = ("files", "tar")
+
+if orjson is not None:
+    _METADATA_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+_HEADER_SEPARATOR = b"\n" + b"-" * 50 + b"\n"
+
+def _document_parts(doc: Any) -> Tuple[bytes, bytes]:
+    """Render a document's header (ID and metadata) and text as saved on disk."""
+    metadata = getattr(doc, 'metadata', None) or {}
+    if orjson is not None:
+        # orjson handles datetimes, UUIDs and dataclasses natively
+        metadata_bytes = orjson.dumps(metadata, default=str, option=_METADATA_OPTIONS)
+    else:
+        metadata_bytes = json.dumps(metadata, indent=2, default=str).encode("utf-8")
+    header = b"".join((
+        f"Document ID: {doc.doc_id}\nMetadata: ".encode("utf-8"),
+        metadata_bytes,
+        _HEADER_SEPARATOR,
+    ))
+    return header, doc.text.encode("utf-8")
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+def _write_document(filepath: str, doc: Any) -> None:
+    """Save document text and metadata to a single file."""
+    header, body = _document_parts(doc)
+    fd = os.open(filepath, _WRITE_FLAGS, 0o644)
+    try:
+        written = 0
+        if hasattr(os, "writev"):
+            # Header and body go out in one scatter-gather syscall
+            written = os.writev(fd, [header, body])
+        if written == len(header) + len(body):
+            return
+        # Short write, or no writev on this platform: write the rest
+        data = memoryview(header + body)[written:]
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def _write_document_batch(files: Sequence[Tuple[str, Any]]) -> None:
+    """Save a batch of (filepath, document) pairs from one worker thread."""
+    for filepath, doc in files:
+        _write_document(filepath, doc)
+
+def _write_documents_tar(
+    documents: Sequence[Any],
+    archive_path: Path,
+    filename_for: Callable[[int, Any], str],
+) -> None:
+    """Save all documents as members of one uncompressed tar archive."""
+    mtime = int(time.time())
+    with tarfile.open(archive_path, "w") as tf:
+        for i, doc in enumerate(documents):
+            data = b"".join(_document_parts(doc))
+            info = tarfile.TarInfo(name=filename_for(i, doc))
+            info.size = len(data)
+            info.mtime = mtime
+            tf.addfile(info, io.BytesIO(data))
+
+async def save_documents(
+    documents: Sequence[Any],
+    output_dir: Path,
+    filename_for: Callable[[int, Any], str],
+    output_format: str = "files",
+    max_concurrency: int = 32,
+    batch_size: int = 64,
+) -> Path:
+    """
+    Save documents without blocking the event loop
+    
+    With the "files" format each document becomes its own file. Writes are
+    grouped into batches, one worker thread call per batch, and batches run
+    concurrently, bounded by a semaphore so large ingestions don't queue
+    thousands of pending writes. The "tar" format streams every document into
+    a single ``documents.tar`` with the same member names, which avoids
+    creating one inode per document on large ingestions.
+    
+    Args:
+        documents: Documents to save
+        output_dir: Directory to write into (must exist)
+        filename_for: Maps (index, document) to the output file name
+        output_format: "files" or "tar"
+        max_concurrency: Maximum number of write batches in flight
+        batch_size: Number of documents written per worker thread call
+        
+    Returns:
+        The output directory, or the archive path for the "tar" format
+    """
+    if output_format == "tar":
+        archive_path = output_dir / "documents.tar"
+        await asyncio.to_thread(_write_documents_tar, documents, archive_path, filename_for)
+        return archive_path
+    if output_format != "files":
+        raise ValueError(f"Unsupported output format: {output_format}")
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    output_dir_str = os.fspath(output_dir)
+    files = [
+        (os.path.join(output_dir_str, filename_for(i, doc)), doc)
+        for i, doc in enumerate(documents)
+    ]
+    
+    async def write(batch: Sequence[Tuple[str, Any]]) -> None:
+        async with semaphore:
+            await asyncio.to_thread(_write_document_batch, batch)
+    
+    await asyncio.gather(*(
+        write(files[start:start + batch_size])
+        for start in range(0, len(files), batch_size)
+    ))
+    return output_dir
+
+# Path separators that can't appear in a document's output filename
+_SAFE_ID_TABLE = str.maketrans({"/": "_", "\\": "_"})
+
+def _full_ingestion_filename(i: int, doc: Any) -> str:
+    """Create a filename based on document ID and index"""
+    safe_id = str(doc.doc_id).translate(_SAFE_ID_TABLE)[:50]
+    return f"document_{i+1:03d}_{safe_id}.txt"
+
+def _simple_ingestion_filename(i: int, doc: Any) -> str:
+    """Create a filename based on document index"""
+    return f"document_{i+1:03d}.txt"
+
+async def run_full_ingestion_pipeline(config_file: str = None, output_format: str = "files"):
     """
     Run the complete ingestion pipeline when all dependencies are available
     
     Args:
         config_file: Path to configuration file
+        output_format: "files" for one text file per document, "tar" for a
+            single documents.tar archive
     """
     print("Political Document Analysis System - Full Ingestion Pipeline")
     print("=" * 60)
@@ -119,7 +250,7 @@ async def run_full_ingestion_pipeline(config_file: str = None):
         
         # Run ingestion
         print("\n4. Running document ingestion...")
-        documents = ingestor.batch_ingest(sources)
+        documents = await ingestor.batch_ingest(sources)
         
         if not documents:
             print("❌ No documents were ingested.")
@@ -132,35 +263,29 @@ async def run_full_ingestion_pipeline(config_file: str = None):
         output_dir = Path("./output/full_ingestion")
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        for i, doc in enumerate(documents):
-            # Create a filename based on document ID or index
-            safe_id = str(doc.doc_id).replace("/", "_").replace("\\", "_")[:50]
-            filename = f"document_{i+1:03d}_{safe_id}.txt"
-            filepath = output_dir / filename
-            
-            # Save document text and metadata
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"Document ID: {doc.doc_id}\n")
-                f.write(f"Metadata: {json.dumps(getattr(doc, 'metadata', {}), indent=2, default=str)}\n")
-                f.write("-" * 50 + "\n")
-                f.write(doc.text)
+        saved_to = await save_documents(documents, output_dir, _full_ingestion_filename, output_format)
         
-        print(f"✅ Saved {len(documents)} documents to {output_dir}")
+        print(f"✅ Saved {len(documents)} documents to {saved_to}")
         
         # Generate report
         print("\n6. Generating report...")
+        total_characters = sum(len(doc.text) for doc in documents)
         report = {
             "total_documents": len(documents),
             "sources_processed": {k: len(v) for k, v in sources.items()},
             "document_stats": {
-                "total_characters": sum(len(doc.text) for doc in documents),
-                "avg_characters": sum(len(doc.text) for doc in documents) // len(documents) if documents else 0,
+                "total_characters": total_characters,
+                "avg_characters": total_characters // len(documents),
             }
         }
         
         report_file = output_dir / "ingestion_report.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            with open(report_file, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_file, 'w') as f:
+                json.dump(report, f, indent=2)
         
         print(f"✅ Report saved to {report_file}")
         
@@ -171,37 +296,43 @@ async def run_full_ingestion_pipeline(config_file: str = None):
         # Import only what we need
         from llama_index.core import SimpleDirectoryReader
         
-        # Process only local directories
+        def load_directory(directory):
+            reader = SimpleDirectoryReader(
+                input_dir=directory,
+                filename_as_id=True,
+                recursive=True
+            )
+            return reader.load_data()
+        
+        # Process only local directories, reading them concurrently
+        directories = sources.get("local_directories", [])
+        semaphore = asyncio.Semaphore((os.cpu_count() or 1) * 4)
+        
+        async def load_bounded(directory):
+            async with semaphore:
+                return await asyncio.to_thread(load_directory, directory)
+        
+        results = await asyncio.gather(
+            *(load_bounded(directory) for directory in directories),
+            return_exceptions=True
+        )
+        
         local_docs = []
-        for directory in sources.get("local_directories", []):
-            try:
-                reader = SimpleDirectoryReader(
-                    input_dir=directory,
-                    filename_as_id=True,
-                    recursive=True
-                )
-                docs = reader.load_data()
-                local_docs.extend(docs)
-                print(f"✅ Loaded {len(docs)} documents from {directory}")
-            except Exception as e:
-                print(f"❌ Error loading from {directory}: {e}")
+        for directory, result in zip(directories, results):
+            if isinstance(result, Exception):
+                print(f"❌ Error loading from {directory}: {result}")
+            else:
+                local_docs.extend(result)
+                print(f"✅ Loaded {len(result)} documents from {directory}")
         
         if local_docs:
             # Save documents
             output_dir = Path("./output/simple_ingestion")
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            for i, doc in enumerate(local_docs):
-                filename = f"document_{i+1:03d}.txt"
-                filepath = output_dir / filename
-                
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(f"Document ID: {doc.doc_id}\n")
-                    f.write(f"Metadata: {json.dumps(getattr(doc, 'metadata', {}), indent=2, default=str)}\n")
-                    f.write("-" * 50 + "\n")
-                    f.write(doc.text)
+            saved_to = await save_documents(local_docs, output_dir, _simple_ingestion_filename, output_format)
             
-            print(f"✅ Saved {len(local_docs)} documents to {output_dir}")
+            print(f"✅ Saved {len(local_docs)} documents to {saved_to}")
         else:
             print("❌ No documents were processed.")
     
@@ -210,13 +341,15 @@ async def run_full_ingestion_pipeline(config_file: str = None):
 
 def main():
     """Main function"""
-    # Check if a config file was provided as command line argument
-    config_file = None
-    if len(sys.argv) > 1:
-        config_file = sys.argv[1]
+    parser = argparse.ArgumentParser(description="Full ingestion pipeline for political documents")
+    parser.add_argument("config_file", nargs="?", default=None,
+                       help="JSON file listing the sources to ingest (default: built-in sources)")
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS, default="files",
+                       help="Save one file per document or a single documents.tar (default: files)")
+    args = parser.parse_args()
     
     # Run the pipeline
-    asyncio.run(run_full_ingestion_pipeline(config_file))
+    asyncio.run(run_full_ingestion_pipeline(args.config_file, args.output_format))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
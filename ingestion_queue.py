@@ -4,14 +4,173 @@ Ingestion Queue Script for Political Document Analysis System
 This script demonstrates how to queue up ingestion runs for later processing.
 """
 
+import asyncio
 import json
 import os
+import sqlite3
 import sys
+from contextlib import closing
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-# Add the current directory to Python path
-sys.path.append(str(Path(__file__).parent))
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding/decoding
+    orjson = None
+
+# Pending jobs are processed in this order
+PRIORITY_ORDER = {"high": 0, "normal": 1, "low": 2}
+
+# Directory holding job files, the status log and the index
+JOBS_DIR = Path("./ingestion_jobs")
+
+# SQLite index of every job, so listing and claiming don't rescan job files
+INDEX_FILE = "index.db"
+
+# Jobs directories whose index this process has already reconciled
+_reconciled_dirs = set()
+
+def _load_job(job_file):
+    """Read a job configuration file"""
+    if orjson is not None:
+        with open(job_file, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(job_file, 'r') as f:
+        return json.load(f)
+
+def _save_job(job_file, job_config):
+    """Atomically write a job configuration file"""
+    if orjson is not None:
+        data = orjson.dumps(job_config, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(job_config, indent=2).encode("utf-8")
+    
+    # Write to a temporary file and rename so readers never see a partial job
+    tmp_file = job_file.with_suffix(".tmp")
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_file, job_file)
+
+def _log_job_status(job_file, status, timestamp):
+    """Append a status transition to the jobs directory's status log"""
+    entry = json.dumps({"job": job_file.stem, "status": status, "at": timestamp})
+    with open(job_file.parent / "status.jsonl", 'a', encoding='utf-8') as f:
+        f.write(entry + "\n")
+
+def _read_job_entry(path):
+    """Load a job file, returning the exception instead of raising it"""
+    try:
+        return _load_job(path)
+    except Exception as e:
+        return e
+
+def _index_row(job_file, job_config):
+    """Build the index row for a job"""
+    priority = job_config.get("priority", "normal")
+    return (
+        str(job_file),
+        priority,
+        PRIORITY_ORDER.get(priority, PRIORITY_ORDER["normal"]),
+        job_config.get("created_at", ""),
+        job_config.get("status", "pending"),
+    )
+
+def _rebuild_index(conn, jobs_dir):
+    """Reconcile the index with the job files on disk
+    
+    Rows of deleted job files are dropped and job files added by hand are
+    indexed. Rows already indexed are kept, since the index owns job status.
+    """
+    # scandir's entries carry the file type, so no extra stat per job
+    with os.scandir(jobs_dir) as it:
+        listed = {entry.path for entry in it
+                  if entry.name.endswith(".json") and entry.is_file()}
+    indexed = {path for path, in conn.execute("SELECT path FROM jobs")}
+    
+    # Re-check before deleting: a job may have been created since the listing
+    removed = [(path,) for path in indexed - listed if not os.path.exists(path)]
+    if removed:
+        with conn:
+            conn.executemany("DELETE FROM jobs WHERE path = ?", removed)
+    
+    job_files = [Path(path) for path in listed - indexed]
+    if not job_files:
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(16, len(job_files))) as executor:
+        job_configs = list(executor.map(_read_job_entry, job_files))
+    
+    rows = []
+    for job_file, job_config in zip(job_files, job_configs):
+        if isinstance(job_config, Exception):
+            print(f"  - {job_file.name} (error reading: {job_config})")
+        else:
+            rows.append(_index_row(job_file, job_config))
+    with conn:
+        # Don't overwrite a row indexed (or claimed) since the listing
+        conn.executemany("INSERT OR IGNORE INTO jobs VALUES (?, ?, ?, ?, ?)", rows)
+
+def _connect_index(jobs_dir):
+    """Open the jobs index, reconciling it with the job files on first use in this process"""
+    index_file = jobs_dir / INDEX_FILE
+    
+    conn = sqlite3.connect(index_file, timeout=30)
+    # WAL lets listing readers run while another process claims a job
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS jobs ("
+        "path TEXT PRIMARY KEY, priority TEXT, priority_rank INTEGER, "
+        "created_at TEXT, status TEXT)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS jobs_by_priority "
+        "ON jobs (status, priority_rank, created_at)"
+    )
+    key = os.path.abspath(jobs_dir)
+    if key not in _reconciled_dirs:
+        _rebuild_index(conn, jobs_dir)
+        _reconciled_dirs.add(key)
+    return conn
+
+def _index_job(job_file, job_config):
+    """Insert or update a job's row in the index"""
+    with closing(_connect_index(job_file.parent)) as conn, conn:
+        conn.execute("INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?)",
+                     _index_row(job_file, job_config))
+
+def _set_index_status(job_file, status):
+    """Record a job's status in the index"""
+    with closing(_connect_index(job_file.parent)) as conn, conn:
+        conn.execute("UPDATE jobs SET status = ? WHERE path = ?", (status, str(job_file)))
+
+def _claim_job(job_file):
+    """Mark a pending job as processing; False if another worker got it first"""
+    with closing(_connect_index(job_file.parent)) as conn, conn:
+        cursor = conn.execute(
+            "UPDATE jobs SET status = 'processing' WHERE path = ? AND status = 'pending'",
+            (str(job_file),)
+        )
+        return cursor.rowcount == 1
+
+def _claim_next_job(jobs_dir):
+    """Atomically claim the highest priority pending job"""
+    with closing(_connect_index(jobs_dir)) as conn:
+        # Take the write lock up front so two processes can't claim the same job
+        conn.isolation_level = None
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT path FROM jobs WHERE status = 'pending' "
+                "ORDER BY priority_rank, created_at LIMIT 1"
+            ).fetchone()
+            if row is not None:
+                conn.execute("UPDATE jobs SET status = 'processing' WHERE path = ?", row)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    return Path(row[0]) if row is not None else None
 
 def create_ingestion_job(sources, job_name=None, priority="normal"):
     """
@@ -26,7 +185,7 @@ def create_ingestion_job(sources, job_name=None, priority="normal"):
         Path to the job file
     """
     # Create jobs directory
-    jobs_dir = Path("./ingestion_jobs")
+    jobs_dir = JOBS_DIR
     jobs_dir.mkdir(exist_ok=True)
     
     # Generate job name if not provided
@@ -47,62 +206,66 @@ def create_ingestion_job(sources, job_name=None, priority="normal"):
     }
     
     # Save job configuration
-    with open(job_file, 'w') as f:
-        json.dump(job_config, f, indent=2)
+    _save_job(job_file, job_config)
+    _index_job(job_file, job_config)
     
     print(f"✅ Ingestion job '{job_name}' created and saved to {job_file}")
     return job_file
 
 def list_pending_jobs():
-    """List all pending ingestion jobs"""
-    jobs_dir = Path("./ingestion_jobs")
+    """List all pending ingestion jobs, highest priority first"""
+    jobs_dir = JOBS_DIR
     if not jobs_dir.exists():
         print("No ingestion jobs directory found.")
         return []
     
-    job_files = list(jobs_dir.glob("*.json"))
-    if not job_files:
+    with closing(_connect_index(jobs_dir)) as conn:
+        rows = conn.execute(
+            "SELECT path, priority FROM jobs WHERE status = 'pending' "
+            "ORDER BY priority_rank, created_at"
+        ).fetchall()
+    if not rows:
         print("No pending ingestion jobs found.")
         return []
     
     print("Pending ingestion jobs:")
     pending_jobs = []
-    for job_file in job_files:
-        try:
-            with open(job_file, 'r') as f:
-                job_config = json.load(f)
-            if job_config.get("status") == "pending":
-                pending_jobs.append(job_file)
-                print(f"  - {job_file.name} (priority: {job_config.get('priority', 'normal')})")
-        except Exception as e:
-            print(f"  - {job_file.name} (error reading: {e})")
+    for path, priority in rows:
+        job_file = Path(path)
+        pending_jobs.append(job_file)
+        print(f"  - {job_file.name} (priority: {priority})")
     
     return pending_jobs
 
-def process_next_job():
-    """Process the next pending ingestion job"""
-    pending_jobs = list_pending_jobs()
-    if not pending_jobs:
-        print("No pending jobs to process.")
-        return
+async def process_job(job_file, claimed=False):
+    """
+    Process a single ingestion job
+    
+    Blocking file I/O runs in worker threads so several jobs can be
+    processed concurrently on one event loop.
     
-    # For simplicity, process the first job
-    job_file = pending_jobs[0]
+    Args:
+        job_file: Path to the job configuration file
+        claimed: Whether the job was already claimed in the index
+    """
+    if not claimed and not await asyncio.to_thread(_claim_job, job_file):
+        print(f"Skipping job {job_file.name}: already claimed")
+        return
     
     print(f"Processing job: {job_file.name}")
     
+    job_config = None
     try:
         # Load job configuration
-        with open(job_file, 'r') as f:
-            job_config = json.load(f)
+        job_config = await asyncio.to_thread(_load_job, job_file)
         
-        # Update status to processing
+        # Update status to processing. Intermediate transitions only go to
+        # the status log; the job file is rewritten once, at the end.
         job_config["status"] = "processing"
         job_config["started_at"] = datetime.now().isoformat()
-        with open(job_file, 'w') as f:
-            json.dump(job_config, f, indent=2)
+        await asyncio.to_thread(_log_job_status, job_file, "processing", job_config["started_at"])
         
-        print("Job status updated to 'processing'")
+        print(f"Job {job_file.name} status updated to 'processing'")
         
         # Here you would normally run the actual ingestion
         # For this demo, we'll just simulate it
@@ -110,29 +273,116 @@ def process_next_job():
         print(f"Sources to process: {job_config['sources']}")
         
         # Simulate processing time
-        import time
-        time.sleep(2)
+        await asyncio.sleep(2)
         
         # Update status to completed
         job_config["status"] = "completed"
         job_config["completed_at"] = datetime.now().isoformat()
-        with open(job_file, 'w') as f:
-            json.dump(job_config, f, indent=2)
+        await asyncio.to_thread(_save_job, job_file, job_config)
+        await asyncio.to_thread(_set_index_status, job_file, "completed")
         
-        print("✅ Job completed successfully!")
+        print(f"✅ Job {job_file.name} completed successfully!")
         
     except Exception as e:
-        print(f"❌ Error processing job: {e}")
+        print(f"❌ Error processing job {job_file.name}: {e}")
         # Update status to failed
         try:
+            await asyncio.to_thread(_set_index_status, job_file, "failed")
+            if job_config is None:
+                return
             job_config["status"] = "failed"
             job_config["error"] = str(e)
             job_config["failed_at"] = datetime.now().isoformat()
-            with open(job_file, 'w') as f:
-                json.dump(job_config, f, indent=2)
-        except:
+            await asyncio.to_thread(_save_job, job_file, job_config)
+        except Exception:
             pass
 
+async def _job_worker(queue):
+    """Process jobs from the queue until cancelled"""
+    while True:
+        job_file = await queue.get()
+        try:
+            await process_job(job_file)
+        finally:
+            queue.task_done()
+
+async def process_all_jobs(concurrency=8):
+    """
+    Process every pending ingestion job with a pool of queue workers
+    
+    Args:
+        concurrency: Maximum number of jobs processed at the same time
+    """
+    pending_jobs = list_pending_jobs()
+    if not pending_jobs:
+        print("No pending jobs to process.")
+        return
+    
+    queue = asyncio.Queue()
+    for job_file in pending_jobs:
+        queue.put_nowait(job_file)
+    
+    workers = [
+        asyncio.create_task(_job_worker(queue))
+        for _ in range(min(concurrency, len(pending_jobs)))
+    ]
+    try:
+        await queue.join()
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+    
+    print(f"✅ Processed {len(pending_jobs)} jobs")
+
+def process_next_job():
+    """Process the next pending ingestion job"""
+    jobs_dir = JOBS_DIR
+    job_file = _claim_next_job(jobs_dir) if jobs_dir.exists() else None
+    if job_file is None:
+        print("No pending jobs to process.")
+        return
+    
+    asyncio.run(process_job(job_file, claimed=True))
+
+def _drain_jobs():
+    """Claim and process pending jobs until none are left; runs in a worker process"""
+    processed = 0
+    while True:
+        job_file = _claim_next_job(JOBS_DIR)
+        if job_file is None:
+            return processed
+        asyncio.run(process_job(job_file, claimed=True))
+        processed += 1
+
+def drain_jobs(max_workers=None):
+    """
+    Process every pending ingestion job across a pool of worker processes
+    
+    Each worker keeps claiming the next job from the index until the queue
+    is empty, so CPU-bound ingestion runs in parallel and jobs queued while
+    draining are picked up too.
+    
+    Args:
+        max_workers: Maximum number of worker processes (default: CPU count)
+    """
+    pending_jobs = list_pending_jobs()
+    if not pending_jobs:
+        print("No pending jobs to process.")
+        return
+    
+    workers = min(max_workers or os.cpu_count() or 1, len(pending_jobs))
+    processed = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_drain_jobs) for _ in range(workers)]
+        for future in as_completed(futures):
+            try:
+                processed += future.result()
+            except Exception as e:
+                print(f"❌ Worker process failed: {e}")
+    
+    print(f"✅ Processed {processed} jobs with {workers} worker processes")
+
 def main():
     """Main function to handle command line arguments"""
     if len(sys.argv) < 2:
@@ -140,6 +390,8 @@ def main():
         print("  python ingestion_queue.py create [job_name]  # Create a new ingestion job")
         print("  python ingestion_queue.py list              # List pending jobs")
         print("  python ingestion_queue.py process           # Process next pending job")
+        print("  python ingestion_queue.py process-all [N]   # Process all pending jobs, N at a time")
+        print("  python ingestion_queue.py drain [N]         # Process all pending jobs in N worker processes")
         return
     
     command = sys.argv[1]
@@ -162,9 +414,17 @@ def main():
     elif command == "process":
         process_next_job()
         
+    elif command == "process-all":
+        concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+        asyncio.run(process_all_jobs(concurrency))
+        
+    elif command == "drain":
+        max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        drain_jobs(max_workers)
+        
     else:
         print(f"Unknown command: {command}")
-        print("Available commands: create, list, process")
+        print("Available commands: create, list, process, process-all, drain")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,10 +1,108 @@
 """
 Configuration management system for the LlamaIndex Political Document Manager.
 """
+import copy
 import json
+import mmap
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding/decoding
+    orjson = None
+
+# Prefer PyYAML's libyaml-backed C loader/dumper when it was built with them
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+
+# Built-in configuration used when no file exists for a config type
+_DEFAULT_CONFIGS: Dict[str, Dict[str, Any]] = {
+    "database": {
+        "sql_database": {
+            "type": "sqlite",
+            "database": "app.db",
+            "host": "localhost",
+            "port": 5432,
+            "username": "",
+            "password": ""
+        },
+        "neo4j_database": {
+            "uri": "bolt://localhost:7687",
+            "username": "neo4j",
+            "password": ""
+        },
+        "vector_store": {
+            "type": "chroma",
+            "persist_directory": "./chroma_db"
+        }
+    },
+    "deployment": {
+        "environment": "development",
+        "debug": True,
+        "log_level": "INFO",
+        "host": "localhost",
+        "port": 8000,
+        "worker_processes": 1,
+        "max_workers": 4,
+        "timeout": 30
+    },
+    "document_sources": {
+        "political_documents": {
+            "enabled": True,
+            "sources": [
+                {"type": "directory", "path": "./data/political"},
+                {"type": "api", "url": "https://api.example.com/political"}
+            ],
+            "update_frequency": "daily",
+            "filters": ["government", "policy", "legislation"]
+        }
+    },
+    "web_interface": {
+        "enabled": True,
+        "theme": "default",
+        "title": "LlamaIndex Political Document Manager",
+        "features": {
+            "document_upload": True,
+            "search": True,
+            "analytics": True,
+            "configuration": True
+        }
+    }
+}
+
+_VALID_ENVIRONMENTS = frozenset({"development", "staging", "production"})
+
+# Sentinel for keys absent from a config section
+_MISSING = object()
+
+# JSON configs at least this large are memory-mapped rather than read
+_MMAP_THRESHOLD = 64 * 1024
+
+
+@lru_cache(maxsize=64)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a JSON or YAML config file.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key: editing the file
+    changes its stat signature, so a stale parse is never returned.
+    """
+    with open(path, 'rb') as f:
+        if not path.endswith(".json"):
+            return yaml.load(f, Loader=YamlLoader)
+        if orjson is None:
+            return json.loads(f.read())
+        if size < _MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        # Large files are parsed straight from the page cache, without a copy
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
 
 class ConfigurationManager:
     """Configuration manager for the application."""
@@ -12,69 +110,111 @@ class ConfigurationManager:
     def __init__(self, config_dir: Optional[Path] = None):
         self.config_dir = config_dir or Path("./config")
         self.config_dir.mkdir(exist_ok=True)
-        self._config_cache = {}
+        # config_name -> (file stat signature, parsed config)
+        self._config_cache: Dict[str, Tuple[Optional[Tuple[str, int, int]], Dict[str, Any]]] = {}
+        # (config_name, suffix) -> file path
+        self._paths: Dict[Tuple[str, str], Path] = {}
+        self._validators = {
+            "database": self._validate_database_config,
+            "deployment": self._validate_deployment_config,
+            "document_sources": self._validate_document_sources_config,
+            "web_interface": self._validate_web_interface_config
+        }
         
+    def _config_path(self, config_name: str, suffix: str) -> Path:
+        """Return the (cached) path of a config file."""
+        key = (config_name, suffix)
+        path = self._paths.get(key)
+        if path is None:
+            path = self._paths[key] = self.config_dir / f"{config_name}{suffix}"
+        return path
+    
+    def _stat_config(self, config_name: str) -> Optional[Tuple[str, int, int]]:
+        """Return ``(path, mtime_ns, size)`` of the file backing a config, if any."""
+        for suffix in (".json", ".yaml"):
+            path = self._config_path(config_name, suffix)
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            return (str(path), st.st_mtime_ns, st.st_size)
+        return None
+    
     def load_config(self, config_name: str) -> Dict[str, Any]:
-        """Load configuration from file."""
-        if config_name in self._config_cache:
-            return self._config_cache[config_name]
-        
-        config_file = self.config_dir / f"{config_name}.json"
-        yaml_file = self.config_dir / f"{config_name}.yaml"
-        
-        if config_file.exists():
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-        elif yaml_file.exists():
-            with open(yaml_file, 'r') as f:
-                config = yaml.safe_load(f)
+        """Load configuration from file.
+        
+        Parsed configs are cached and revalidated against the file's mtime and
+        size, so edits made on disk are picked up without re-parsing unchanged
+        files on every call.
+        """
+        signature = self._stat_config(config_name)
+        
+        cached = self._config_cache.get(config_name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        if signature is not None:
+            # The parse cache is shared between managers; copy so callers can
+            # mutate their config without affecting other instances.
+            config = copy.deepcopy(_parse_config_file(*signature))
         else:
             config = self._get_default_config(config_name)
         
-        self._config_cache[config_name] = config
+        self._config_cache[config_name] = (signature, config)
         return config
     
     def save_config(self, config_name: str, config: Dict[str, Any], format: str = "json") -> None:
         """Save configuration to file."""
         if format == "json":
-            config_file = self.config_dir / f"{config_name}.json"
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            config_file = self._config_path(config_name, ".json")
+            if orjson is not None:
+                with open(config_file, 'wb') as f:
+                    f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(config_file, 'w') as f:
+                    json.dump(config, f, indent=2)
         elif format == "yaml":
-            config_file = self.config_dir / f"{config_name}.yaml"
+            config_file = self._config_path(config_name, ".yaml")
             with open(config_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
+                yaml.dump(config, f, Dumper=YamlDumper, default_flow_style=False)
         else:
             raise ValueError(f"Unsupported format: {format}")
         
         # Update cache
-        self._config_cache[config_name] = config
+        _parse_config_file.cache_clear()
+        self._config_cache[config_name] = (self._stat_config(config_name), config)
     
     def update_config(self, config_name: str, updates: Dict[str, Any]) -> Dict[str, Any]:
-        """Update configuration with new values."""
+        """Update configuration with new values.
+        
+        The file is only rewritten when the updates change something or the
+        config has not been saved yet.
+        """
         config = self.load_config(config_name)
         
-        def deep_update(base_dict, update_dict):
-            for key, value in update_dict.items():
-                if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-                    deep_update(base_dict[key], value)
-                else:
-                    base_dict[key] = value
+        def deep_update(base_dict, update_dict) -> bool:
+            # Walk nested sections with an explicit stack instead of recursion
+            changed = False
+            stack = [(base_dict, update_dict)]
+            while stack:
+                base, update = stack.pop()
+                for key, value in update.items():
+                    current = base.get(key, _MISSING)
+                    if isinstance(current, dict) and isinstance(value, dict):
+                        stack.append((current, value))
+                    elif current is _MISSING or current != value:
+                        base[key] = value
+                        changed = True
+            return changed
         
-        deep_update(config, updates)
-        self.save_config(config_name, config)
+        changed = deep_update(config, updates)
+        if changed or self._config_cache[config_name][0] is None:
+            self.save_config(config_name, config)
         return config
     
     def validate_config(self, config_name: str, config: Dict[str, Any]) -> bool:
         """Validate configuration against schema."""
-        validators = {
-            "database": self._validate_database_config,
-            "deployment": self._validate_deployment_config,
-            "document_sources": self._validate_document_sources_config,
-            "web_interface": self._validate_web_interface_config
-        }
-        
-        validator = validators.get(config_name)
+        validator = self._validators.get(config_name)
         if validator:
             return validator(config)
         
@@ -82,61 +222,7 @@ class ConfigurationManager:
     
     def _get_default_config(self, config_name: str) -> Dict[str, Any]:
         """Get default configuration for a given config type."""
-        defaults = {
-            "database": {
-                "sql_database": {
-                    "type": "sqlite",
-                    "database": "app.db",
-                    "host": "localhost",
-                    "port": 5432,
-                    "username": "",
-                    "password": ""
-                },
-                "neo4j_database": {
-                    "uri": "bolt://localhost:7687",
-                    "username": "neo4j",
-                    "password": ""
-                },
-                "vector_store": {
-                    "type": "chroma",
-                    "persist_directory": "./chroma_db"
-                }
-            },
-            "deployment": {
-                "environment": "development",
-                "debug": True,
-                "log_level": "INFO",
-                "host": "localhost",
-                "port": 8000,
-                "worker_processes": 1,
-                "max_workers": 4,
-                "timeout": 30
-            },
-            "document_sources": {
-                "political_documents": {
-                    "enabled": True,
-                    "sources": [
-                        {"type": "directory", "path": "./data/political"},
-                        {"type": "api", "url": "https://api.example.com/political"}
-                    ],
-                    "update_frequency": "daily",
-                    "filters": ["government", "policy", "legislation"]
-                }
-            },
-            "web_interface": {
-                "enabled": True,
-                "theme": "default",
-                "title": "LlamaIndex Political Document Manager",
-                "features": {
-                    "document_upload": True,
-                    "search": True,
-                    "analytics": True,
-                    "configuration": True
-                }
-            }
-        }
-        
-        return defaults.get(config_name, {})
+        return copy.deepcopy(_DEFAULT_CONFIGS.get(config_name, {}))
     
     def _validate_database_config(self, config: Dict[str, Any]) -> bool:
         """Validate database configuration."""
@@ -173,8 +259,8 @@ class ConfigurationManager:
             return False
         
         # Validate environment is valid
-        valid_environments = ["development", "staging", "production"]
-        if config["environment"] not in valid_environments:
+        environment = config["environment"]
+        if not isinstance(environment, str) or environment not in _VALID_ENVIRONMENTS:
             return False
         
         return True
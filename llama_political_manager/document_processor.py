@@ -1,90 +1,458 @@
 """
 Document processor for political documents in the LlamaIndex Political Document Manager.
 """
+import copy
+import hashlib
+import multiprocessing
+import os
+import pickle
 import re
+import weakref
+from collections import Counter, OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterable, Iterator, List, NamedTuple, Optional, Sized, Tuple
 import json
 from datetime import datetime
 
+try:
+    import cld3
+except ImportError:  # optional: language detection
+    cld3 = None
+
+try:
+    import xxhash
+except ImportError:  # optional: faster content hashing
+    xxhash = None
+
+try:
+    import numba
+    import numpy as np
+except ImportError:  # optional: JIT-compiled syllable counting
+    numba = None
+
+
+# Entity patterns, compiled once. Each pattern is scanned separately so
+# overlapping matches (e.g. "White House" and "House") are all reported.
+_ORG_PATTERNS = tuple(re.compile(p) for p in (
+    r'\b[A-Z][a-z]+ (?:Department|Agency|Commission|Bureau|Office)\b',
+    r'\b(?:House|Senate) (?:of Representatives)?\b',
+    r'\bCongress\b',
+    r'\bWhite House\b',
+    r'\bSupreme Court\b'
+))
+
+_BILL_PATTERNS = tuple(re.compile(p) for p in (
+    r'\b[A-Z]+\.?[A-Z]*\.? \d+\b',  # H.R. 1234, S. 567
+    r'\b(?:Bill|Act) (?:No\. )?\d+\b'
+))
+
+_DATE_PATTERNS = tuple(re.compile(p) for p in (
+    r'\b\d{1,2}\/\d{1,2}\/\d{4}\b',  # MM/DD/YYYY
+    r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December) \d{1,2}, \d{4}\b'
+))
+
+# Entity categories reported by _extract_entities, and the patterns that
+# find each one (people and locations have none yet)
+_ENTITY_CATEGORIES = ("organizations", "people", "locations", "bills", "dates")
+_ENTITY_PATTERNS = {
+    "organizations": _ORG_PATTERNS,
+    "bills": _BILL_PATTERNS,
+    "dates": _DATE_PATTERNS,
+}
+
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+_VOWEL_GROUP_RE = re.compile(r'[aeiouy]+')
+_NO_VOWEL_WORD_RE = re.compile(r'\b[b-df-hj-np-tv-xz]+\b')
+
+# With numba installed, documents whose space-joined words reach this many
+# characters have their syllables counted by the compiled kernel
+_NUMBA_SYLLABLE_MIN_CHARS = 100_000
+
+# Bit i is set when chr(ord("a") + i) is a vowel (a, e, i, o, u, y)
+_VOWEL_MASK = sum(1 << (ord(c) - ord("a")) for c in "aeiouy")
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _count_syllables_kernel(buf):
+        """Count syllables in lowercase ASCII words separated by single spaces."""
+        total = 0
+        in_vowel = 0
+        word_has_vowel = 0
+        in_word = 0
+        for c in buf:
+            if c == 32:
+                # A word without vowels still counts as one syllable
+                total += in_word & (1 - word_has_vowel)
+                in_vowel = word_has_vowel = in_word = 0
+            else:
+                is_vowel = (_VOWEL_MASK >> (c - 97)) & 1
+                total += is_vowel & (1 - in_vowel)
+                word_has_vowel |= is_vowel
+                in_vowel = is_vowel
+                in_word = 1
+        return total + (in_word & (1 - word_has_vowel))
+
+# Number of documents whose analyses each processor keeps for repeated content
+_ANALYSIS_CACHE_SIZE = 1024
+
+# Content-derived fields of a processed document, cached together by process_document
+_DOCUMENT_ANALYSES = frozenset({
+    "word_count", "readability_score", "political_analysis",
+    "entities", "topics", "sentiment", "classification"
+})
+
+
+def _content_key(content: str) -> Tuple[int, bytes]:
+    """Key identifying a document's content: its length and a 128-bit digest."""
+    data = content.encode("utf-8", "surrogatepass")
+    if xxhash is not None:
+        return len(content), xxhash.xxh3_128_digest(data)
+    return len(content), hashlib.blake2b(data, digest_size=16).digest()
+
+
+# Language detection only looks at this many leading characters
+_LANGUAGE_SAMPLE_CHARS = 2048
+
+# Characters counted as sentence ends by the readability score
+_SENTENCE_TERMINATORS = ".!?"
+
+# Common stop words ignored by topic extraction
+_STOP_WORDS = frozenset({
+    "that", "this", "with", "from", "they", "them", "their", "there", "these", "those",
+    "will", "would", "could", "should", "shall", "must", "have", "been", "were", "are",
+    "the", "and", "or", "but", "not", "all", "any", "can", "had", "has", "was", "is",
+    "for", "of", "to", "in", "on", "at", "by", "as", "be", "do", "so", "if", "no",
+    "more", "such", "only", "other", "than", "then", "them", "well", "also"
+})
+
+# Policy areas and the keywords that indicate them
+_POLITICAL_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "healthcare": ("healthcare", "health", "medical", "insurance", "medicare", "medicaid"),
+    "economy": ("economic", "economy", "financial", "budget", "tax", "fiscal", "gdp"),
+    "environment": ("environmental", "climate", "green", "pollution", "carbon", "energy"),
+    "education": ("education", "school", "university", "student", "teacher", "learning"),
+    "defense": ("defense", "military", "security", "armed forces", "veteran"),
+    "immigration": ("immigration", "immigrant", "border", "visa", "refugee", "asylum"),
+    "justice": ("justice", "court", "law", "legal", "constitutional", "rights"),
+    "infrastructure": ("infrastructure", "transportation", "roads", "bridges", "broadband")
+}
+
+# Basic sentiment word lists
+_POSITIVE_WORDS = frozenset({
+    "good", "great", "excellent", "positive", "beneficial", "improve", "progress",
+    "success", "effective", "strong", "support", "help", "better", "opportunity"
+})
+
+_NEGATIVE_WORDS = frozenset({
+    "bad", "terrible", "negative", "harmful", "problem", "crisis", "fail", "failure",
+    "weak", "oppose", "against", "worse", "threat", "danger", "concern", "issue"
+})
+
+# Document type indicators
+_DOCUMENT_TYPE_INDICATORS: Dict[str, Tuple[str, ...]] = {
+    "bill": ("bill", "act", "section", "subsection", "whereas", "be it enacted"),
+    "speech": ("thank you", "my fellow", "today i", "we must", "colleagues"),
+    "report": ("executive summary", "findings", "recommendations", "methodology"),
+    "press_release": ("for immediate release", "contact:", "announces", "statement"),
+    "policy": ("policy", "framework", "guidelines", "principles", "objectives"),
+    "legislation": ("congress", "senate", "house", "amendment", "vote")
+}
+
+
+class _TokenizedText(NamedTuple):
+    """A document lowercased and split into words once, shared by the analyses."""
+    lower: str
+    words: List[str]
+    word_count: int  # whitespace-separated words, as reported in "word_count"
+    word_freq: Counter  # occurrences of each of ``words``, in first-seen order
+    keywords: set  # political and document-type keywords found in the text
+
+
+class _KeywordMatcher:
+    """Find which of a fixed set of keywords occur in a lowercased text.
+    
+    The keywords of several tables (each mapping a group to its keywords) are
+    searched together, so one ``find`` serves every table. Keywords are
+    checked longest first, and a keyword contained in one that was already
+    found (e.g. "health" in "healthcare", "act" in "contact:") is marked
+    present without scanning the text again.
+    """
+    
+    def __init__(self, tables: Dict[str, Dict[str, Tuple[str, ...]]]):
+        self.tables = {
+            table: {group: tuple(keywords) for group, keywords in groups.items()}
+            for table, groups in tables.items()
+        }
+        keywords = sorted(
+            {kw for groups in self.tables.values() for kws in groups.values() for kw in kws},
+            key=len, reverse=True
+        )
+        self._keywords = tuple(
+            (kw, tuple(other for other in keywords if other != kw and other in kw))
+            for kw in keywords
+        )
+    
+    def find(self, text: str) -> set:
+        """Return the keywords that occur in ``text``."""
+        found = set()
+        for kw, contained in self._keywords:
+            if kw not in found and kw in text:
+                found.add(kw)
+                found.update(contained)
+        return found
+    
+    def count(self, table: str, found: set) -> Dict[str, int]:
+        """Return, per group of ``table``, how many of its keywords were found."""
+        return {
+            group: sum(1 for kw in keywords if kw in found)
+            for group, keywords in self.tables[table].items()
+        }
+
+
+# Batches with less content than this (in characters, roughly half a second
+# of serial work) are processed serially; shipping documents to worker
+# processes and results back costs more than it saves
+PARALLEL_BATCH_MIN_CHARS = 1_000_000
+
+# Per-process DocumentProcessor used by process_batch's worker pool
+_batch_processor = None
+
+
+def _init_batch_worker(processor_state: bytes) -> None:
+    global _batch_processor
+    _batch_processor = pickle.loads(processor_state)
+
+
+def _process_batch_item_in_worker(item: Tuple[str, Optional[Dict[str, Any]], str]) -> Dict[str, Any]:
+    content, metadata, processed_at = item
+    return _batch_processor._process_batch_item(content, metadata, processed_at)
+
+
 class DocumentProcessor:
     """Process and analyze political documents."""
     
     def __init__(self, config_manager=None):
         self.config_manager = config_manager
-        self.political_keywords = {
-            "healthcare": ["healthcare", "health", "medical", "insurance", "medicare", "medicaid"],
-            "economy": ["economic", "economy", "financial", "budget", "tax", "fiscal", "gdp"],
-            "environment": ["environmental", "climate", "green", "pollution", "carbon", "energy"],
-            "education": ["education", "school", "university", "student", "teacher", "learning"],
-            "defense": ["defense", "military", "security", "armed forces", "veteran"],
-            "immigration": ["immigration", "immigrant", "border", "visa", "refugee", "asylum"],
-            "justice": ["justice", "court", "law", "legal", "constitutional", "rights"],
-            "infrastructure": ["infrastructure", "transportation", "roads", "bridges", "broadband"]
-        }
-        
-    def process_document(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Process a document and extract relevant information."""
+        self.political_keywords = {area: list(keywords) for area, keywords in _POLITICAL_KEYWORDS.items()}
+        # Matcher for the political keywords it was built from; see _matcher()
+        self._keyword_matcher: Optional[_KeywordMatcher] = None
+        self._matcher_keywords: Dict[str, Tuple[str, ...]] = {}
+        # content key -> analyses of that content by name, least recently used first
+        self._analysis_cache: "OrderedDict[Tuple[int, bytes], Dict[str, Any]]" = OrderedDict()
+        # Worker pool kept between parallel batches, and its size
+        self._pool = None
+        self._pool_processes = 0
+        
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes get a copy of the processor without the pool or cache
+        state = self.__dict__.copy()
+        state["_analysis_cache"] = OrderedDict()
+        state["_pool"] = None
+        state["_pool_processes"] = 0
+        return state
+    
+    def close(self) -> None:
+        """Shut down the worker pool of parallel batches, if one was started."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+            self._pool_processes = 0
+    
+    def _get_pool(self, processes: int):
+        """Return the worker pool for parallel batches, starting it on first use."""
+        if self._pool is None or self._pool_processes != processes:
+            self.close()
+            # Workers rebuild this processor (config and subclass included) from
+            # its pickled state; the pool must not hold a reference back to it
+            self._pool = multiprocessing.Pool(processes, initializer=_init_batch_worker,
+                                              initargs=(pickle.dumps(self),))
+            self._pool_processes = processes
+            weakref.finalize(self, self._pool.terminate)
+        return self._pool
+        
+    def process_document(self, content: str, metadata: Optional[Dict[str, Any]] = None,
+                         processed_at: Optional[str] = None,
+                         detect_language: bool = False) -> Dict[str, Any]:
+        """Process a document and extract relevant information.
+        
+        ``processed_at`` defaults to the current time; batches pass one
+        timestamp for all of their documents. The language is reported as
+        English unless ``detect_language`` is set.
+        """
         metadata = metadata or {}
         
+        # Everything derived from the content alone is reused for repeated text
+        key = _content_key(content)
+        cached = self._cached_analyses(key)
+        if cached is not None and cached.keys() >= _DOCUMENT_ANALYSES:
+            analyses = copy.deepcopy(cached)
+        else:
+            tokens = self._tokenize(content)
+            analyses = {
+                "word_count": tokens.word_count,
+                "readability_score": self._calculate_readability(content, tokens),
+                "political_analysis": self._score_political_content(content, tokens),
+                "entities": self._extract_entities(content),
+                "topics": self._extract_topics(content, tokens),
+                "sentiment": self._analyze_sentiment(content, tokens),
+                "classification": self._classify_document(content, tokens)
+            }
+            self._cache_analyses(key, analyses)
+        
         # Basic text processing
         processed_doc = {
             "content": content,
             "metadata": metadata,
-            "processed_at": datetime.now().isoformat(),
-            "word_count": len(content.split()),
+            "processed_at": processed_at or datetime.now().isoformat(),
+            "word_count": analyses["word_count"],
             "character_count": len(content),
-            "language": self._detect_language(content),
-            "readability_score": self._calculate_readability(content)
+            "language": self._detect_language(content) if detect_language else "en",
+            "readability_score": analyses["readability_score"]
         }
         
         # Political analysis
-        processed_doc["political_analysis"] = self._analyze_political_content(content)
+        processed_doc["political_analysis"] = analyses["political_analysis"]
         
         # Extract entities and topics
-        processed_doc["entities"] = self._extract_entities(content)
-        processed_doc["topics"] = self._extract_topics(content)
+        processed_doc["entities"] = analyses["entities"]
+        processed_doc["topics"] = analyses["topics"]
         
         # Sentiment analysis
-        processed_doc["sentiment"] = self._analyze_sentiment(content)
+        processed_doc["sentiment"] = analyses["sentiment"]
         
         # Document classification
-        processed_doc["classification"] = self._classify_document(content)
+        processed_doc["classification"] = analyses["classification"]
         
         return processed_doc
     
-    def process_batch(self, documents: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
-        """Process multiple documents in batch."""
-        results = []
-        for content, metadata in documents:
-            try:
-                result = self.process_document(content, metadata)
-                result["processing_status"] = "success"
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    "content": content[:100] + "..." if len(content) > 100 else content,
-                    "metadata": metadata,
-                    "processing_status": "error",
-                    "error": str(e),
-                    "processed_at": datetime.now().isoformat()
-                })
-        
-        return results
+    def process_batch(self, documents: List[Tuple[str, Optional[Dict[str, Any]]]],
+                      processes: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Process multiple documents in batch.
+        
+        Batches of at least ``PARALLEL_BATCH_MIN_CHARS`` characters of content
+        are spread over a pool of worker processes (``processes``, default: CPU
+        count) that is kept for later batches until ``close()``; pass
+        ``processes=1`` to always process serially. Results keep input order
+        and share the batch's start time as ``processed_at``.
+        """
+        return list(self.iter_process_batch(documents, processes))
+    
+    def iter_process_batch(self, documents: Iterable[Tuple[str, Optional[Dict[str, Any]]]],
+                           processes: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Process documents like ``process_batch``, yielding each result in turn.
+        
+        Callers that stream results to disk or a database never hold the
+        whole batch of processed documents at once. Only sized collections
+        of ``documents`` are processed in parallel.
+        """
+        processed_at = datetime.now().isoformat()
+        processes = processes or os.cpu_count() or 1
+        if (processes == 1 or not isinstance(documents, Sized)
+                or sum(len(content) for content, _ in documents if isinstance(content, str))
+                < PARALLEL_BATCH_MIN_CHARS):
+            for content, metadata in documents:
+                yield self._process_batch_item(content, metadata, processed_at)
+            return
+        
+        items = ((content, metadata, processed_at) for content, metadata in documents)
+        yield from self._get_pool(processes).imap(_process_batch_item_in_worker, items, chunksize=16)
+    
+    def _process_batch_item(self, content: str, metadata: Optional[Dict[str, Any]],
+                            processed_at: str) -> Dict[str, Any]:
+        """Process one batch document, reporting failures as an error result."""
+        try:
+            result = self.process_document(content, metadata, processed_at)
+            result["processing_status"] = "success"
+            return result
+        except Exception as e:
+            return {
+                "content": content[:100] + "..." if len(content) > 100 else content,
+                "metadata": metadata,
+                "processing_status": "error",
+                "error": str(e),
+                "processed_at": processed_at
+            }
+    
+    def count_policy_mentions(self, content: str) -> Dict[str, int]:
+        """Count, per policy area, how many of its keywords occur in the text."""
+        cached = self._cached_analyses(_content_key(content))
+        if cached is not None and "political_analysis" in cached:
+            return {
+                area: data["mentions"]
+                for area, data in cached["political_analysis"]["analysis_by_topic"].items()
+            }
+        
+        matcher = self._matcher()
+        return matcher.count("political", matcher.find(content.lower()))
+    
+    def _matcher(self) -> _KeywordMatcher:
+        """Return the keyword matcher for the current ``political_keywords``.
+        
+        Policy areas and document-type indicators share one keyword search.
+        The keywords may be edited at any time, so the matcher is rebuilt (and
+        analyses cached under the old keywords dropped) whenever they change.
+        """
+        keywords = {area: tuple(kws) for area, kws in self.political_keywords.items()}
+        if self._keyword_matcher is None or keywords != self._matcher_keywords:
+            self._keyword_matcher = _KeywordMatcher({
+                "political": keywords,
+                "document_type": _DOCUMENT_TYPE_INDICATORS,
+            })
+            self._matcher_keywords = keywords
+            self._analysis_cache.clear()
+        return self._keyword_matcher
+    
+    def _cached_analyses(self, key: Tuple[int, bytes]) -> Optional[Dict[str, Any]]:
+        """Return the cached analyses of some content, marking them recently used."""
+        self._matcher()  # drops the cache if the keywords were edited
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(key)
+        return cached
+    
+    def _cache_analyses(self, key: Tuple[int, bytes], analyses: Dict[str, Any]) -> None:
+        """Cache copies of analyses of some content, evicting the least recently used content."""
+        self._analysis_cache.setdefault(key, {}).update(copy.deepcopy(analyses))
+        self._analysis_cache.move_to_end(key)
+        if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
     
-    def _analyze_political_content(self, content: str) -> Dict[str, Any]:
-        """Analyze political content and extract key topics."""
+    def _tokenize(self, content: str) -> _TokenizedText:
+        """Lowercase and split a document into words once for all analyses."""
         content_lower = content.lower()
+        words = _WORD_RE.findall(content_lower)
+        return _TokenizedText(content_lower, words, len(content.split()), Counter(words),
+                              self._matcher().find(content_lower))
+    
+    def _analyze_political_content(self, content: str, tokens: Optional[_TokenizedText] = None) -> Dict[str, Any]:
+        """Analyze political content and extract key topics.
+        
+        Results are cached by content, so analyzing the same text again (a
+        repeated tool call) skips scoring it, and tokenizing it unless the
+        caller already has ``tokens``.
+        """
+        key = _content_key(content)
+        cached = self._cached_analyses(key)
+        if cached is not None and "political_analysis" in cached:
+            return copy.deepcopy(cached["political_analysis"])
+        
+        result = self._score_political_content(content, tokens)
+        self._cache_analyses(key, {"political_analysis": result})
+        return result
+    
+    def _score_political_content(self, content: str, tokens: Optional[_TokenizedText]) -> Dict[str, Any]:
+        """Score a document's policy-area keyword mentions."""
+        tokens = tokens or self._tokenize(content)
+        total_words = tokens.word_count
         
         analysis = {}
-        for area, keywords in self.political_keywords.items():
-            mentions = sum(1 for kw in keywords if kw in content_lower)
-            keyword_density = mentions / len(content.split()) if content.split() else 0
+        for area, mentions in self._matcher().count("political", tokens.keywords).items():
+            keyword_density = mentions / total_words if total_words else 0
             
             analysis[area] = {
                 "mentions": mentions,
                 "keyword_density": round(keyword_density * 100, 2),
-                "relevance": self._calculate_relevance(mentions, len(content.split()))
+                "relevance": self._calculate_relevance(mentions, total_words)
             }
         
         # Find primary topics (top 3 by mentions)
@@ -100,96 +468,38 @@ class DocumentProcessor:
     
     def _extract_entities(self, content: str) -> Dict[str, List[str]]:
         """Extract named entities from the document."""
-        # Simple entity extraction using patterns
-        entities = {
-            "organizations": [],
-            "people": [],
-            "locations": [],
-            "bills": [],
-            "dates": []
-        }
-        
-        # Extract organization patterns
-        org_patterns = [
-            r'\b[A-Z][a-z]+ (?:Department|Agency|Commission|Bureau|Office)\b',
-            r'\b(?:House|Senate) (?:of Representatives)?\b',
-            r'\bCongress\b',
-            r'\bWhite House\b',
-            r'\bSupreme Court\b'
-        ]
-        
-        for pattern in org_patterns:
-            matches = re.findall(pattern, content)
-            entities["organizations"].extend(matches)
-        
-        # Extract bill patterns
-        bill_patterns = [
-            r'\b[A-Z]+\.?[A-Z]*\.? \d+\b',  # H.R. 1234, S. 567
-            r'\b(?:Bill|Act) (?:No\. )?\d+\b'
-        ]
-        
-        for pattern in bill_patterns:
-            matches = re.findall(pattern, content)
-            entities["bills"].extend(matches)
-        
-        # Extract dates
-        date_patterns = [
-            r'\b\d{1,2}\/\d{1,2}\/\d{4}\b',  # MM/DD/YYYY
-            r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December) \d{1,2}, \d{4}\b'
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.findall(pattern, content)
-            entities["dates"].extend(matches)
-        
-        # Remove duplicates
-        for key in entities:
-            entities[key] = list(set(entities[key]))
-        
-        return entities
+        # Simple entity extraction using patterns. Matches go straight into a
+        # set per category, so duplicates are dropped as they are found.
+        entities = {category: set() for category in _ENTITY_CATEGORIES}
+        for category, patterns in _ENTITY_PATTERNS.items():
+            for pattern in patterns:
+                entities[category].update(pattern.findall(content))
+        
+        return {category: list(found) for category, found in entities.items()}
     
-    def _extract_topics(self, content: str) -> List[str]:
+    def _extract_topics(self, content: str, tokens: Optional[_TokenizedText] = None) -> List[str]:
         """Extract main topics from the document."""
-        # Simple topic extraction using keyword frequency
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', content.lower())
-        word_freq = {}
-        
-        # Common stop words to ignore
-        stop_words = {
-            "that", "this", "with", "from", "they", "them", "their", "there", "these", "those",
-            "will", "would", "could", "should", "shall", "must", "have", "been", "were", "are",
-            "the", "and", "or", "but", "not", "all", "any", "can", "had", "has", "was", "is",
-            "for", "of", "to", "in", "on", "at", "by", "as", "be", "do", "so", "if", "no",
-            "more", "such", "only", "other", "than", "then", "them", "well", "also"
-        }
+        tokens = tokens or self._tokenize(content)
         
-        for word in words:
-            if word not in stop_words and len(word) > 3:
-                word_freq[word] = word_freq.get(word, 0) + 1
+        # Simple topic extraction using keyword frequency
+        word_freq = Counter({
+            word: freq for word, freq in tokens.word_freq.items()
+            if len(word) > 3 and word not in _STOP_WORDS
+        })
         
         # Get top topics by frequency
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        topics = [word for word, freq in sorted_words[:10] if freq > 1]
+        topics = [word for word, freq in word_freq.most_common(10) if freq > 1]
         
         return topics
     
-    def _analyze_sentiment(self, content: str) -> Dict[str, Any]:
+    def _analyze_sentiment(self, content: str, tokens: Optional[_TokenizedText] = None) -> Dict[str, Any]:
         """Simple sentiment analysis."""
-        # Basic sentiment word lists
-        positive_words = {
-            "good", "great", "excellent", "positive", "beneficial", "improve", "progress",
-            "success", "effective", "strong", "support", "help", "better", "opportunity"
-        }
-        
-        negative_words = {
-            "bad", "terrible", "negative", "harmful", "problem", "crisis", "fail", "failure",
-            "weak", "oppose", "against", "worse", "threat", "danger", "concern", "issue"
-        }
+        word_freq = (tokens or self._tokenize(content)).word_freq
         
-        words = re.findall(r'\b[a-zA-Z]+\b', content.lower())
-        
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
+        # Look up the short sentiment lists in the document's word counts
+        # rather than testing every word against them
+        positive_count = sum(word_freq[word] for word in _POSITIVE_WORDS)
+        negative_count = sum(word_freq[word] for word in _NEGATIVE_WORDS)
         total_sentiment_words = positive_count + negative_count
         
         if total_sentiment_words == 0:
@@ -212,29 +522,15 @@ class DocumentProcessor:
             "confidence": abs(sentiment_score)
         }
     
-    def _classify_document(self, content: str) -> Dict[str, Any]:
+    def _classify_document(self, content: str, tokens: Optional[_TokenizedText] = None) -> Dict[str, Any]:
         """Classify the document type."""
-        content_lower = content.lower()
-        
-        # Document type indicators
-        indicators = {
-            "bill": ["bill", "act", "section", "subsection", "whereas", "be it enacted"],
-            "speech": ["thank you", "my fellow", "today i", "we must", "colleagues"],
-            "report": ["executive summary", "findings", "recommendations", "methodology"],
-            "press_release": ["for immediate release", "contact:", "announces", "statement"],
-            "policy": ["policy", "framework", "guidelines", "principles", "objectives"],
-            "legislation": ["congress", "senate", "house", "amendment", "vote"]
-        }
-        
-        scores = {}
-        for doc_type, keywords in indicators.items():
-            score = sum(1 for keyword in keywords if keyword in content_lower)
-            scores[doc_type] = score
+        tokens = tokens or self._tokenize(content)
+        scores = self._matcher().count("document_type", tokens.keywords)
         
         # Determine primary classification
         if scores:
             primary_type = max(scores, key=scores.get)
-            confidence = scores[primary_type] / len(content.split()) * 100
+            confidence = scores[primary_type] / tokens.word_count * 100
         else:
             primary_type = "general"
             confidence = 0.0
@@ -270,15 +566,22 @@ class DocumentProcessor:
         return round(min(base_score + relevance_bonus, 1.0), 3)
     
     def _detect_language(self, content: str) -> str:
-        """Simple language detection."""
-        # For now, assume English. In production, use a proper language detection library
-        return "en"
+        """Detect the document language from its opening text."""
+        # Without cld3, or without a reliable prediction, assume English
+        if cld3 is None:
+            return "en"
+        
+        prediction = cld3.get_language(content[:_LANGUAGE_SAMPLE_CHARS])
+        if prediction is None or not prediction.is_reliable:
+            return "en"
+        return prediction.language
     
-    def _calculate_readability(self, content: str) -> float:
+    def _calculate_readability(self, content: str, tokens: Optional[_TokenizedText] = None) -> float:
         """Calculate readability score (simplified Flesch Reading Ease)."""
-        sentences = content.count('.') + content.count('!') + content.count('?')
-        words = len(content.split())
-        syllables = self._count_syllables(content)
+        tokens = tokens or self._tokenize(content)
+        sentences = sum(map(content.count, _SENTENCE_TERMINATORS))
+        words = tokens.word_count
+        syllables = self._count_syllables(content, tokens)
         
         if sentences == 0 or words == 0:
             return 0.0
@@ -287,16 +590,18 @@ class DocumentProcessor:
         score = 206.835 - 1.015 * (words / sentences) - 84.6 * (syllables / words)
         return round(max(0, min(100, score)), 1)
     
-    def _count_syllables(self, content: str) -> int:
+    def _count_syllables(self, content: str, tokens: Optional[_TokenizedText] = None) -> int:
         """Estimate syllable count."""
-        words = re.findall(r'\b[a-zA-Z]+\b', content.lower())
-        total_syllables = 0
+        words = (tokens or self._tokenize(content)).words
+        
+        # Simple syllable counting - count vowel groups, with at least one
+        # syllable per word. Scanning the space-joined words once replaces a
+        # regex call per word; the spaces keep groups from spanning words.
+        text = " ".join(words)
+        if numba is not None and len(text) >= _NUMBA_SYLLABLE_MIN_CHARS:
+            return int(_count_syllables_kernel(np.frombuffer(text.encode("ascii"), dtype=np.uint8)))
         
-        for word in words:
-            # Simple syllable counting - count vowel groups
-            vowels = re.findall(r'[aeiouy]+', word)
-            syllables = len(vowels)
-            # At least one syllable per word
-            total_syllables += max(1, syllables)
+        vowel_groups = len(_VOWEL_GROUP_RE.findall(text))
+        words_without_vowels = len(_NO_VOWEL_WORD_RE.findall(text))
         
-        return total_syllables
\ No newline at end of file
+        return vowel_groups + words_without_vowels
\ No newline at end of file
@@ -2,10 +2,49 @@
 MCP (Model Context Protocol) Server implementation for LlamaIndex Political Document Manager.
 """
 import asyncio
+import hmac
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Callable, Optional
+from functools import lru_cache
 from pathlib import Path
 
+from .document_processor import DocumentProcessor
+
+
+# API keys accepted by PoliticalDocumentMCPServer.validate_tool_access
+_VALID_API_KEYS = frozenset({b"valid-api-key", b"admin-key", b"service-key"})
+
+
+@lru_cache(maxsize=1)
+def _default_document_processor() -> DocumentProcessor:
+    """Processor used for content analysis when the server was given none."""
+    return DocumentProcessor()
+
+
+# Maximum number of files index_documents reads at the same time
+_INDEX_WORKERS = 16
+
+
+def _index_document(path: str) -> Dict[str, Any]:
+    """Read one document and summarize it for the index_documents tool."""
+    try:
+        content = Path(path).read_text()
+    except FileNotFoundError:
+        return {
+            "path": path, 
+            "indexed": False, 
+            "error": "File not found"
+        }
+    
+    return {
+        "path": path,
+        "indexed": True,
+        "content_length": len(content),
+        "keywords": sum(1 for w in content.split() if len(w) > 3)
+    }
+
+
 class MCPServer:
     """MCP server for integrating with other services."""
     
@@ -16,10 +55,13 @@ class MCPServer:
         self.clients = []
         self.host = "localhost"
         self.port = 8080
+        # Created in start() so it belongs to the running event loop
+        self._stopped: Optional[asyncio.Event] = None
         
     async def start(self, host: str = "localhost", port: int = 8080):
         """Start the MCP server."""
         self.is_running = True
+        self._stopped = asyncio.Event()
         self.host = host
         self.port = port
         print(f"MCP Server started on {host}:{port}")
@@ -28,14 +70,23 @@ class MCPServer:
         """Stop the MCP server."""
         self.is_running = False
         self.clients.clear()
+        if self._stopped is not None:
+            self._stopped.set()
         print("MCP Server stopped")
+    
+    async def wait_stopped(self):
+        """Wait until the server has been stopped."""
+        if self.is_running and self._stopped is not None:
+            await self._stopped.wait()
         
     def register_tool(self, name: str, description: str, handler: Callable):
         """Register a tool with the MCP server."""
         self.tools[name] = {
             "name": name,
             "description": description,
-            "handler": handler
+            "handler": handler,
+            # Checked once here rather than on every call
+            "is_coroutine": asyncio.iscoroutinefunction(handler)
         }
         
     def register_resource(self, uri: str, content: Any):
@@ -50,7 +101,7 @@ class MCPServer:
         tool = self.tools[tool_name]
         handler = tool["handler"]
         
-        if asyncio.iscoroutinefunction(handler):
+        if tool["is_coroutine"]:
             return await handler(**arguments)
         else:
             return handler(**arguments)
@@ -84,23 +135,12 @@ class PoliticalDocumentMCPServer(MCPServer):
         
         def index_documents(document_paths: List[str]) -> Dict[str, Any]:
             """Index documents for search."""
-            results = []
-            for path in document_paths:
-                doc_path = Path(path)
-                if doc_path.exists():
-                    content = doc_path.read_text()
-                    results.append({
-                        "path": path,
-                        "indexed": True,
-                        "content_length": len(content),
-                        "keywords": len([w for w in content.split() if len(w) > 3])
-                    })
-                else:
-                    results.append({
-                        "path": path, 
-                        "indexed": False, 
-                        "error": "File not found"
-                    })
+            # File reads dominate, so documents are indexed in parallel threads
+            if len(document_paths) > 1:
+                with ThreadPoolExecutor(max_workers=min(_INDEX_WORKERS, len(document_paths))) as executor:
+                    results = list(executor.map(_index_document, document_paths))
+            else:
+                results = [_index_document(path) for path in document_paths]
             
             return {
                 "documents": results, 
@@ -109,18 +149,11 @@ class PoliticalDocumentMCPServer(MCPServer):
         
         def analyze_political_content(text: str) -> Dict[str, Any]:
             """Analyze political content in documents."""
-            text_lower = text.lower()
-            
-            policy_areas = {
-                "healthcare": ["healthcare", "health", "medical", "insurance"],
-                "economy": ["economic", "economy", "financial", "budget", "tax"],
-                "environment": ["environmental", "climate", "green", "pollution"],
-                "education": ["education", "school", "university", "student"]
-            }
+            # Share the processor's policy keywords and matcher
+            processor = self.document_processor or _default_document_processor()
             
             analysis = {}
-            for area, keywords in policy_areas.items():
-                mentions = sum(1 for kw in keywords if kw in text_lower)
+            for area, mentions in processor.count_policy_mentions(text).items():
                 analysis[area] = {
                     "mentions": mentions,
                     "relevance": "high" if mentions > 2 else "medium" if mentions > 0 else "low"
@@ -220,12 +253,17 @@ class PoliticalDocumentMCPServer(MCPServer):
     
     def validate_tool_access(self, tool_name: str, api_key: Optional[str] = None) -> bool:
         """Validate access to tools (basic security)."""
-        if not api_key:
+        if not api_key or not isinstance(api_key, str):
             return False
         
-        # Basic API key validation (in production, use proper authentication)
-        valid_keys = ["valid-api-key", "admin-key", "service-key"]
-        return api_key in valid_keys
+        # Basic API key validation (in production, use proper authentication).
+        # Compare against every key in constant time so response timing
+        # doesn't reveal how much of a key matched.
+        candidate = api_key.encode("utf-8")
+        valid = False
+        for key in _VALID_API_KEYS:
+            valid |= hmac.compare_digest(candidate, key)
+        return valid
     
     async def handle_secure_tool_call(self, tool_name: str, arguments: Dict[str, Any], 
                                     api_key: Optional[str] = None) -> Any:
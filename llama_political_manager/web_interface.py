@@ -1,20 +1,30 @@
 """
 Web interface implementation for the LlamaIndex Political Document Manager.
 """
-from typing import Dict, Any, List, Optional
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 import json
+import time
 
 class MockRequest:
     """Mock HTTP request object."""
     
+    __slots__ = ("method", "path", "json_data", "query_params", "form_data", "headers")
+    
     def __init__(self, method: str = "GET", path: str = "/", json_data: Optional[Dict] = None, 
                  query_params: Optional[Dict] = None, form_data: Optional[Dict] = None):
+        self.reset(method, path, json_data, query_params, form_data)
+    
+    def reset(self, method: str = "GET", path: str = "/", json_data: Optional[Dict] = None,
+              query_params: Optional[Dict] = None, form_data: Optional[Dict] = None) -> "MockRequest":
+        """Reinitialize the request in place so the object can be reused."""
         self.method = method
         self.path = path
         self.json_data = json_data or {}
         self.query_params = query_params or {}
         self.form_data = form_data or {}
         self.headers = {}
+        return self
         
     def get_json(self):
         return self.json_data
@@ -23,9 +33,29 @@ class MockRequest:
         return self.form_data
 
 
+# Released requests waiting to be reused by borrow_request()
+_REQUEST_POOL: Deque[MockRequest] = deque(maxlen=64)
+
+
+def borrow_request(method: str = "GET", path: str = "/", **kwargs) -> MockRequest:
+    """Get a request object, reusing a released one when available."""
+    try:
+        request = _REQUEST_POOL.pop()
+    except IndexError:
+        return MockRequest(method, path, **kwargs)
+    return request.reset(method, path, **kwargs)
+
+
+def release_request(request: MockRequest) -> None:
+    """Return a request to the pool once its response has been handled."""
+    _REQUEST_POOL.append(request)
+
+
 class MockResponse:
     """Mock HTTP response object."""
     
+    __slots__ = ("data", "status_code", "headers")
+    
     def __init__(self, data: Any = None, status_code: int = 200, headers: Optional[Dict] = None):
         self.data = data
         self.status_code = status_code
@@ -35,11 +65,28 @@ class MockResponse:
         return self.data
 
 
+# Query-string values of common limits and offsets, parsed ahead of time
+_SMALL_INTS: Dict[str, int] = {str(i): i for i in range(1001)}
+
+
+def _parse_int(value: Any, default: int) -> int:
+    """Parse an integer query parameter, skipping int() for common small values."""
+    if value is None:
+        return default
+    parsed = _SMALL_INTS.get(value)
+    return parsed if parsed is not None else int(value)
+
+
+# Looked up for methods that have no routes
+_EMPTY_ROUTES: Dict[str, Callable] = {}
+
+
 class MockWebApp:
     """Mock web application for testing and demonstration."""
     
     def __init__(self):
-        self.routes = {}
+        # Handlers keyed by method, then path
+        self.routes: Dict[str, Dict[str, Callable]] = {}
         self.middleware = []
         self.config = {}
         
@@ -49,28 +96,51 @@ class MockWebApp:
         
         def decorator(func):
             for method in methods:
-                route_key = f"{method}:{path}"
-                self.routes[route_key] = func
+                self.routes.setdefault(method, {})[path] = func
             return func
         
         return decorator
     
     def handle_request(self, request: MockRequest) -> MockResponse:
         """Handle a mock HTTP request."""
-        route_key = f"{request.method}:{request.path}"
-        
-        if route_key in self.routes:
-            handler = self.routes[route_key]
-            try:
-                result = handler(request)
-                if isinstance(result, MockResponse):
-                    return result
-                else:
-                    return MockResponse(result)
-            except Exception as e:
-                return MockResponse({"error": str(e)}, status_code=500)
-        else:
+        handler = self.routes.get(request.method, _EMPTY_ROUTES).get(request.path)
+        if handler is None:
             return MockResponse({"error": "Not found"}, status_code=404)
+        
+        try:
+            result = handler(request)
+            if isinstance(result, MockResponse):
+                return result
+            else:
+                return MockResponse(result)
+        except Exception as e:
+            return MockResponse({"error": str(e)}, status_code=500)
+
+
+_HEALTH_COMPONENTS = {
+    "database": "connected",
+    "vector_store": "connected",
+    "document_processor": "running"
+}
+
+# (epoch second, formatted timestamp) of the most recent health check
+_health_timestamp: Tuple[int, str] = (-1, "")
+
+
+def _health_response() -> MockResponse:
+    """Build the health payload, formatting its timestamp at most once per second."""
+    global _health_timestamp
+    now = int(time.time())
+    second, timestamp = _health_timestamp
+    if second != now:
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _health_timestamp = (now, timestamp)
+    return MockResponse({
+        "status": "healthy",
+        "timestamp": timestamp,
+        "version": "1.0.0",
+        "components": dict(_HEALTH_COMPONENTS)
+    })
 
 
 class WebInterface:
@@ -143,22 +213,23 @@ class WebInterface:
         @self.app.route("/api/documents", ["GET"])
         def list_documents(request):
             # Mock document listing
-            limit = int(request.query_params.get("limit", 10))
-            offset = int(request.query_params.get("offset", 0))
-            search = request.query_params.get("search", "")
+            limit = _parse_int(request.query_params.get("limit"), 10)
+            offset = _parse_int(request.query_params.get("offset"), 0)
+            search = (request.query_params.get("search") or "").lower()
             
-            # Mock documents
+            # Mock documents; each title is formatted once and only matches are built
+            titles = ((doc_id, f"Political Document {doc_id}") for doc_id in range(offset, offset + limit))
             documents = [
                 {
-                    "id": i + offset,
-                    "title": f"Political Document {i + offset}",
-                    "content": f"Sample content for document {i + offset}",
+                    "id": doc_id,
+                    "title": title,
+                    "content": f"Sample content for document {doc_id}",
                     "category": "political",
                     "date": "2024-01-01",
                     "keywords": ["policy", "government", "reform"]
                 }
-                for i in range(limit)
-                if not search or search.lower() in f"political document {i + offset}".lower()
+                for doc_id, title in titles
+                if not search or search in title.lower()
             ]
             
             return MockResponse({
@@ -248,16 +319,7 @@ class WebInterface:
         
         @self.app.route("/api/health", ["GET"])
         def health_check(request):
-            return MockResponse({
-                "status": "healthy",
-                "timestamp": "2024-01-01T00:00:00Z",
-                "version": "1.0.0",
-                "components": {
-                    "database": "connected",
-                    "vector_store": "connected",
-                    "document_processor": "running"
-                }
-            })
+            return _health_response()
         
         @self.app.route("/config", ["GET"])
         def config_page(request):
@@ -288,6 +350,7 @@ class WebInterface:
                     }
                 ]
             }
+
     
     def run(self, host: str = "localhost", port: int = 8000, debug: bool = False):
         """Run the web interface (mock implementation)."""
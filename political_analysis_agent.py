@@ -14,10 +14,61 @@ from political_entity_extractor import PoliticalEntityExtractor
 from political_knowledge_graph import PoliticalKnowledgeGraph
 from political_mcp_integration import PoliticalMCPIntegration
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+except ImportError:  # optional: faster prompt serialization
+    orjson = None
+
+# Logging is configured by the application, not on import
 logger = logging.getLogger(__name__)
 
+# System prompt shared by every agent instance
+_SYSTEM_PROMPT = """
+        You are an expert political analyst AI assistant. Your role is to analyze political documents,
+        extract relevant information, and answer questions about political entities, relationships,
+        and trends.
+        
+        You have access to specialized tools for:
+        1. Extracting political entities (politicians, parties, legislation, policies)
+        2. Querying a knowledge graph of political relationships
+        3. Fact-checking political claims
+        4. Tracking legislative progress
+        5. Analyzing campaign finance data
+        6. Reviewing voting records
+        
+        When analyzing documents:
+        - Focus on key political entities and their relationships
+        - Identify important policy positions and statements
+        - Note any factual claims that should be verified
+        - Highlight significant political events or developments
+        - Summarize the main points clearly and concisely
+        
+        Always maintain objectivity and cite sources when possible.
+        """
+
+# Metadata of the custom tools; only the bound function differs per agent
+_KG_TOOL_METADATA = ToolMetadata(
+    name="query_political_knowledge_graph",
+    description="Query the political knowledge graph for relationships between entities"
+)
+_EXTRACT_TOOL_METADATA = ToolMetadata(
+    name="extract_political_entities",
+    description="Extract political entities (politicians, parties, legislation, etc.) from text"
+)
+_ANALYZE_TOOL_METADATA = ToolMetadata(
+    name="analyze_political_document",
+    description="Perform comprehensive analysis of a political document"
+)
+
+
+def _entities_excerpt(entities: Dict[str, Any], limit: int) -> str:
+    """Return the first `limit` characters of the serialized entities for a prompt."""
+    if orjson is None:
+        return str(entities)[:limit]
+    # Serialize in C and cut the bytes before decoding, instead of building the full repr
+    return orjson.dumps(entities, default=str)[:limit].decode("utf-8", "ignore")
+
+
 class PoliticalAnalysisAgent:
     """Intelligent agent for analyzing political documents and answering questions"""
     
@@ -67,7 +118,7 @@ class PoliticalAnalysisAgent:
                 tools=all_tools,
                 llm=self.llm,
                 max_iterations=self.config.MAX_AGENT_ITERATIONS,
-                system_prompt=self._get_system_prompt()
+                system_prompt=_SYSTEM_PROMPT
             )
             
             logger.info(f"Political analysis agent initialized with {len(all_tools)} tools")
@@ -87,33 +138,15 @@ class PoliticalAnalysisAgent:
         tools = []
         
         # Add knowledge graph query tool
-        kg_tool = BaseTool(
-            fn=self._query_knowledge_graph,
-            metadata=ToolMetadata(
-                name="query_political_knowledge_graph",
-                description="Query the political knowledge graph for relationships between entities"
-            )
-        )
+        kg_tool = BaseTool(fn=self._query_knowledge_graph, metadata=_KG_TOOL_METADATA)
         tools.append(kg_tool)
         
         # Add entity extraction tool
-        extract_tool = BaseTool(
-            fn=self._extract_political_entities,
-            metadata=ToolMetadata(
-                name="extract_political_entities",
-                description="Extract political entities (politicians, parties, legislation, etc.) from text"
-            )
-        )
+        extract_tool = BaseTool(fn=self._extract_political_entities, metadata=_EXTRACT_TOOL_METADATA)
         tools.append(extract_tool)
         
         # Add document analysis tool
-        analyze_tool = BaseTool(
-            fn=self._analyze_document,
-            metadata=ToolMetadata(
-                name="analyze_political_document",
-                description="Perform comprehensive analysis of a political document"
-            )
-        )
+        analyze_tool = BaseTool(fn=self._analyze_document, metadata=_ANALYZE_TOOL_METADATA)
         tools.append(analyze_tool)
         
         return tools
@@ -125,28 +158,7 @@ class PoliticalAnalysisAgent:
         Returns:
             System prompt string
         """
-        return """
-        You are an expert political analyst AI assistant. Your role is to analyze political documents,
-        extract relevant information, and answer questions about political entities, relationships,
-        and trends.
-        
-        You have access to specialized tools for:
-        1. Extracting political entities (politicians, parties, legislation, policies)
-        2. Querying a knowledge graph of political relationships
-        3. Fact-checking political claims
-        4. Tracking legislative progress
-        5. Analyzing campaign finance data
-        6. Reviewing voting records
-        
-        When analyzing documents:
-        - Focus on key political entities and their relationships
-        - Identify important policy positions and statements
-        - Note any factual claims that should be verified
-        - Highlight significant political events or developments
-        - Summarize the main points clearly and concisely
-        
-        Always maintain objectivity and cite sources when possible.
-        """
+        return _SYSTEM_PROMPT
     
     async def analyze_documents(self, documents: List[Document]) -> Dict[str, Any]:
         """
@@ -161,17 +173,14 @@ class PoliticalAnalysisAgent:
         logger.info(f"Analyzing {len(documents)} political documents")
         
         try:
-            # Extract entities
-            entities = self.entity_extractor.extract_political_entities(documents)
-            
-            # Build knowledge graph
-            kg_results = self.knowledge_graph.build_from_documents(documents)
-            
-            # Perform sentiment analysis
-            sentiment_results = self._analyze_sentiment(documents)
-            
-            # Identify key themes
-            themes = self._identify_themes(documents)
+            # Extract entities, build the knowledge graph, analyze sentiment and
+            # identify themes concurrently; none of them depends on another
+            entities, kg_results, sentiment_results, themes = await asyncio.gather(
+                asyncio.to_thread(self.entity_extractor.extract_political_entities, documents),
+                asyncio.to_thread(self.knowledge_graph.build_from_documents, documents),
+                asyncio.to_thread(self._analyze_sentiment, documents),
+                asyncio.to_thread(self._identify_themes, documents)
+            )
             
             # Generate summary
             summary = await self._generate_summary(documents, entities, themes)
@@ -215,7 +224,6 @@ class PoliticalAnalysisAgent:
             Extracted entities
         """
         # Create a mock document for extraction
-        from llama_index.core import Document
         doc = Document(text=text)
         
         return self.entity_extractor.extract_political_entities([doc])
@@ -231,7 +239,6 @@ class PoliticalAnalysisAgent:
             Analysis results
         """
         # Create a mock document for analysis
-        from llama_index.core import Document
         doc = Document(text=document_text)
         
         # Perform basic analysis
@@ -296,8 +303,9 @@ class PoliticalAnalysisAgent:
         Returns:
             Summary text
         """
-        # Combine document texts
-        combined_text = "\n\n".join([doc.text[:500] for doc in documents[:3]])  # Limit length
+        # Combine document texts (at most three 500-character excerpts)
+        combined_text = "\n\n".join([doc.text[:500] for doc in documents[:3]])
+        entities_text = _entities_excerpt(entities, 500)
         
         # Create summary prompt
         prompt = f"""
@@ -308,10 +316,10 @@ class PoliticalAnalysisAgent:
         4. Significant developments or events
         
         Documents:
-        {combined_text[:2000]}...
+        {combined_text}...
         
         Key Entities:
-        {str(entities)[:500]}...
+        {entities_text}...
         
         Main Themes:
         {', '.join(themes)}
@@ -320,16 +328,18 @@ class PoliticalAnalysisAgent:
         """
         
         # Generate summary using LLM
-        response = self.llm.complete(prompt)
+        response = await self.llm.acomplete(prompt)
         return response.text
     
-    async def answer_question(self, question: str, context: Optional[str] = None) -> str:
+    async def answer_question(self, question: str, context: Optional[str] = None,
+                              raise_errors: bool = False) -> str:
         """
         Answer a political question using the agent
         
         Args:
             question: Question to answer
             context: Additional context (optional)
+            raise_errors: Re-raise failures instead of returning an error message
             
         Returns:
             Answer text
@@ -353,10 +363,14 @@ class PoliticalAnalysisAgent:
             
         except Exception as e:
             logger.error(f"Error answering question: {str(e)}")
+            if raise_errors:
+                raise
             return f"Error answering question: {str(e)}"
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Import configuration
     from political_analysis_init import config
     
@@ -4,76 +4,145 @@ Main initialization and configuration module
 """
 
 import os
+import json
 from dotenv import load_dotenv
 import configparser
 from pathlib import Path
+from typing import Any, Dict, List, NamedTuple
+
+try:
+    import orjson
+except ImportError:  # optional: faster config parsing
+    orjson = None
 
 # Load environment variables
 env_path = Path(__file__).parent / ".env.political_analysis"
 load_dotenv(env_path)
 
 # Load configuration
-config = configparser.ConfigParser()
-config_path = Path(__file__).parent / "political_analysis_config.ini"
-config.read(config_path)
+config_path = Path(__file__).parent / "political_analysis_config.json"
+legacy_config_path = Path(__file__).parent / "political_analysis_config.ini"
+
+
+def _ini_value(value: str) -> Any:
+    """Decode an INI value written as JSON (numbers, booleans, quoted strings, lists)."""
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _from_ini(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Read the legacy INI configuration into the same nested mapping as the JSON file."""
+    parser = configparser.ConfigParser()
+    parser.read(path)
+    return {
+        section: {key: _ini_value(value) for key, value in parser.items(section)}
+        for section in parser.sections()
+    }
+
+
+def _load_settings() -> Dict[str, Dict[str, Any]]:
+    """Load the configuration, falling back to the legacy INI file when there is no JSON one."""
+    try:
+        with open(config_path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return _from_ini(legacy_config_path)
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+_settings = _load_settings()
+
+
+def _setting(section: str, key: str, default: Any) -> Any:
+    value = _settings.get(section, {}).get(key, default)
+    if isinstance(default, bool) and not isinstance(value, bool):
+        # Legacy INI flags (yes/no, on/off, true/false, 1/0) follow ConfigParser.getboolean
+        try:
+            return configparser.ConfigParser.BOOLEAN_STATES[str(value).lower()]
+        except KeyError:
+            raise ValueError(f"Not a boolean: [{section}] {key} = {value}") from None
+    return value
+
 
 # System paths
 PROJECT_ROOT = Path(__file__).parent
-DATA_DIR = PROJECT_ROOT / config.get("paths", "data_dir", fallback="./data")
-OUTPUT_DIR = PROJECT_ROOT / config.get("paths", "output_dir", fallback="./output")
-LOG_DIR = PROJECT_ROOT / config.get("paths", "log_dir", fallback="./logs")
-MODEL_DIR = PROJECT_ROOT / config.get("paths", "model_dir", fallback="./models")
+DATA_DIR = PROJECT_ROOT / _setting("paths", "data_dir", "./data")
+OUTPUT_DIR = PROJECT_ROOT / _setting("paths", "output_dir", "./output")
+LOG_DIR = PROJECT_ROOT / _setting("paths", "log_dir", "./logs")
+MODEL_DIR = PROJECT_ROOT / _setting("paths", "model_dir", "./models")
+
+
+def _ensure_directories(*directories: Path) -> None:
+    """Create missing directories, listing each parent once rather than calling mkdir on every path."""
+    by_parent: Dict[Path, set] = {}
+    for directory in directories:
+        by_parent.setdefault(directory.parent, set()).add(directory.name)
+    
+    for parent, names in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                existing = {entry.name for entry in entries if entry.is_dir()}
+        except FileNotFoundError:
+            existing = set()
+        for name in names - existing:
+            (parent / name).mkdir(exist_ok=True)
+
 
 # Create directories if they don't exist
-for directory in [DATA_DIR, OUTPUT_DIR, LOG_DIR, MODEL_DIR]:
-    directory.mkdir(exist_ok=True)
+_ensure_directories(DATA_DIR, OUTPUT_DIR, LOG_DIR, MODEL_DIR)
 
 # System configuration
-class Config:
-    """Configuration class for the Political Document Analysis System"""
+class Config(NamedTuple):
+    """Configuration for the Political Document Analysis System.
+    
+    Immutable: settings are read as plain tuple fields and the instance can be
+    shared freely across threads and worker processes.
+    """
     
     # Ingestion settings
-    SUPPORTED_FORMATS = config.get("ingestion", "supported_formats", fallback=["pdf", "docx", "txt", "html", "json", "csv"])
-    MAX_CRAWL_DEPTH = config.getint("ingestion", "max_depth", fallback=3)
-    MAX_CRAWL_PAGES = config.getint("ingestion", "max_pages", fallback=1000)
-    RESPECT_ROBOTS_TXT = config.getboolean("ingestion", "respect_robots_txt", fallback=True)
-    CRAWL_DELAY = config.getfloat("ingestion", "delay_between_requests", fallback=1.0)
+    SUPPORTED_FORMATS: List[str] = _setting("ingestion", "supported_formats", ["pdf", "docx", "txt", "html", "json", "csv"])
+    MAX_CRAWL_DEPTH: int = _setting("ingestion", "max_depth", 3)
+    MAX_CRAWL_PAGES: int = _setting("ingestion", "max_pages", 1000)
+    RESPECT_ROBOTS_TXT: bool = _setting("ingestion", "respect_robots_txt", True)
+    CRAWL_DELAY: float = _setting("ingestion", "delay_between_requests", 1.0)
     
     # Extraction settings
-    ENABLE_NER = config.getboolean("extraction", "enable_named_entity_recognition", fallback=True)
-    ENABLE_RELATION_EXTRACTION = config.getboolean("extraction", "enable_relation_extraction", fallback=True)
-    ENABLE_SENTIMENT_ANALYSIS = config.getboolean("extraction", "enable_sentiment_analysis", fallback=True)
-    POLITICAL_ENTITIES = config.get("extraction", "political_entities", fallback=["politician", "political_party", "legislation", "policy", "vote", "election"])
+    ENABLE_NER: bool = _setting("extraction", "enable_named_entity_recognition", True)
+    ENABLE_RELATION_EXTRACTION: bool = _setting("extraction", "enable_relation_extraction", True)
+    ENABLE_SENTIMENT_ANALYSIS: bool = _setting("extraction", "enable_sentiment_analysis", True)
+    POLITICAL_ENTITIES: List[str] = _setting("extraction", "political_entities", ["politician", "political_party", "legislation", "policy", "vote", "election"])
     
     # Graph settings
-    GRAPH_DATABASE = config.get("graph", "graph_database", fallback="neo4j")
-    ENABLE_DYNAMIC_UPDATES = config.getboolean("graph", "enable_dynamic_updates", fallback=True)
-    ENABLE_VISUALIZATION = config.getboolean("graph", "enable_visualization", fallback=True)
-    MIN_CONFIDENCE_SCORE = config.getfloat("graph", "min_confidence_score", fallback=0.7)
-    MAX_RELATIONSHIPS_PER_ENTITY = config.getint("graph", "max_relationships_per_entity", fallback=50)
+    GRAPH_DATABASE: str = _setting("graph", "graph_database", "neo4j")
+    ENABLE_DYNAMIC_UPDATES: bool = _setting("graph", "enable_dynamic_updates", True)
+    ENABLE_VISUALIZATION: bool = _setting("graph", "enable_visualization", True)
+    MIN_CONFIDENCE_SCORE: float = _setting("graph", "min_confidence_score", 0.7)
+    MAX_RELATIONSHIPS_PER_ENTITY: int = _setting("graph", "max_relationships_per_entity", 50)
     
     # MCP settings
-    MCP_SERVER_URL = config.get("mcp", "mcp_server_url", fallback="http://localhost:8000")
-    ENABLE_OAUTH = config.getboolean("mcp", "enable_oauth", fallback=False)
-    MAX_MCP_RETRIES = config.getint("mcp", "max_retries", fallback=3)
+    MCP_SERVER_URL: str = _setting("mcp", "mcp_server_url", "http://localhost:8000")
+    ENABLE_OAUTH: bool = _setting("mcp", "enable_oauth", False)
+    MAX_MCP_RETRIES: int = _setting("mcp", "max_retries", 3)
     
     # Agent settings
-    MAX_AGENT_ITERATIONS = config.getint("agents", "max_iterations", fallback=10)
-    ENABLE_TOOL_USAGE = config.getboolean("agents", "enable_tool_usage", fallback=True)
-    ENABLE_MEMORY = config.getboolean("agents", "enable_memory", fallback=True)
+    MAX_AGENT_ITERATIONS: int = _setting("agents", "max_iterations", 10)
+    ENABLE_TOOL_USAGE: bool = _setting("agents", "enable_tool_usage", True)
+    ENABLE_MEMORY: bool = _setting("agents", "enable_memory", True)
     
     # LLM settings
-    LLM_MODEL_NAME = config.get("llm", "model_name", fallback="gpt-4")
-    LLM_TEMPERATURE = config.getfloat("llm", "temperature", fallback=0.7)
-    LLM_MAX_TOKENS = config.getint("llm", "max_tokens", fallback=2000)
+    LLM_MODEL_NAME: str = _setting("llm", "model_name", "gpt-4")
+    LLM_TEMPERATURE: float = _setting("llm", "temperature", 0.7)
+    LLM_MAX_TOKENS: int = _setting("llm", "max_tokens", 2000)
     
     # Embedding settings
-    EMBEDDING_MODEL_NAME = config.get("embedding", "model_name", fallback="text-embedding-3-large")
-    EMBEDDING_DIMENSIONS = config.getint("embedding", "dimensions", fallback=3072)
+    EMBEDDING_MODEL_NAME: str = _setting("embedding", "model_name", "text-embedding-3-large")
+    EMBEDDING_DIMENSIONS: int = _setting("embedding", "dimensions", 3072)
     
     # Evaluation settings
-    ENABLE_AUTO_EVALUATION = config.getboolean("evaluation", "enable_auto_evaluation", fallback=True)
-    EVALUATION_DATASET_PATH = PROJECT_ROOT / config.get("evaluation", "evaluation_dataset_path", fallback="./data/evaluation")
+    ENABLE_AUTO_EVALUATION: bool = _setting("evaluation", "enable_auto_evaluation", True)
+    EVALUATION_DATASET_PATH: Path = PROJECT_ROOT / _setting("evaluation", "evaluation_dataset_path", "./data/evaluation")
 
 # Initialize configuration
 config = Config()
@@ -4,11 +4,20 @@ Coordinates all components of the political analysis pipeline
 """
 
 import asyncio
+import json
 import logging
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 from llama_index.core import Document
 
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding of the results
+    orjson = None
+
 # Import our modules
 from political_analysis_init import config
 from political_document_ingestor import PoliticalDocumentIngestor
@@ -21,6 +30,75 @@ from political_analysis_agent import PoliticalAnalysisAgent
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Source batches buffered between ingestion and the extraction / graph stages
+PIPELINE_QUEUE_SIZE = 16
+
+class SemanticCache:
+    """Answers to earlier questions, matched by cosine similarity of question embeddings"""
+    
+    def __init__(self, embed_model, threshold: float = 0.92, max_entries: int = 1024):
+        self.embed_model = embed_model
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._exact: Dict[str, str] = {}
+        self._vectors: Optional["np.ndarray"] = None  # L2-normalized, one row per answer
+        self._answers: List[str] = []
+        
+    @staticmethod
+    def _normalize(question: str) -> str:
+        return " ".join(question.lower().split())
+    
+    async def lookup(self, question: str) -> Tuple[Optional[str], Optional["np.ndarray"]]:
+        """
+        Find the cached answer to a question or a close paraphrase of it
+        
+        Returns:
+            The cached answer (or None) and the question's embedding, to be
+            passed back to add() on a miss
+        """
+        key = self._normalize(question)
+        if key in self._exact:
+            return self._exact[key], None
+        
+        import numpy as np  # only needed once a question misses the exact-match cache
+        try:
+            vector = np.asarray(await self.embed_model.aget_query_embedding(key), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Could not embed question for the answer cache: {str(e)}")
+            return None, None
+        vector /= np.linalg.norm(vector) or 1.0
+        
+        if self._answers and self._vectors.shape[1] == vector.shape[0]:
+            scores = self._vectors @ vector
+            best = int(scores.argmax())
+            if scores[best] >= self.threshold:
+                return self._answers[best], vector
+        return None, vector
+    
+    def clear(self) -> None:
+        """Forget every cached answer, e.g. once new documents have changed the graph"""
+        self._exact.clear()
+        self._vectors = None
+        self._answers = []
+    
+    def add(self, question: str, vector: Optional["np.ndarray"], answer: str) -> None:
+        """Remember the answer to a question (and its embedding, when available)"""
+        self._exact[self._normalize(question)] = answer
+        if len(self._exact) > self.max_entries:
+            del self._exact[next(iter(self._exact))]
+        
+        if vector is None:
+            return
+        import numpy as np
+        if not self._answers or self._vectors.shape[1] != vector.shape[0]:
+            self._vectors = vector[np.newaxis, :]
+            self._answers = [answer]
+        else:
+            # Keep the newest max_entries - 1 rows, then append this one
+            start = max(len(self._answers) - (self.max_entries - 1), 0)
+            self._vectors = np.vstack((self._vectors[start:], vector))
+            self._answers = self._answers[start:] + [answer]
+
 class PoliticalAnalysisOrchestrator:
     """Main orchestrator for the political document analysis system"""
     
@@ -31,6 +109,7 @@ class PoliticalAnalysisOrchestrator:
         self.kg = PoliticalKnowledgeGraph(config)
         self.mcp = PoliticalMCPIntegration(config)
         self.agent = PoliticalAnalysisAgent(config)
+        self._qa_cache = SemanticCache(self.kg.embed_model)
         
     async def run_complete_analysis(self, sources: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -45,22 +124,15 @@ class PoliticalAnalysisOrchestrator:
         logger.info("Starting complete political document analysis pipeline")
         
         try:
-            # Step 1: Ingest documents
-            logger.info("Step 1: Ingesting documents")
-            documents = self.ingestor.batch_ingest(sources)
+            # Steps 1-3: Ingest documents, extracting entities and building the
+            # knowledge graph from each source's documents as soon as they arrive
+            logger.info("Steps 1-3: Ingesting documents, extracting political entities and building knowledge graph")
+            documents, entities, kg_results = await self._ingest_extract_and_build(sources)
             
             if not documents:
                 logger.warning("No documents ingested, aborting analysis")
                 return {"error": "No documents ingested"}
             
-            # Step 2: Extract entities
-            logger.info("Step 2: Extracting political entities")
-            entities = self.extractor.extract_political_entities(documents)
-            
-            # Step 3: Build knowledge graph
-            logger.info("Step 3: Building knowledge graph")
-            kg_results = self.kg.build_from_documents(documents)
-            
             # Step 4: Initialize agent
             logger.info("Step 4: Initializing analysis agent")
             agent_initialized = await self.agent.initialize_agent()
@@ -93,6 +165,60 @@ class PoliticalAnalysisOrchestrator:
             logger.error(f"Error in complete analysis pipeline: {str(e)}")
             return {"error": str(e), "status": "failed"}
     
+    async def _ingest_extract_and_build(self, sources: Dict[str, Any]) -> Tuple[List[Document], Dict[str, Any], Dict[str, int]]:
+        """
+        Pipeline ingestion into entity extraction and knowledge-graph construction
+        
+        Each source's documents are handed to both stages through bounded
+        queues while the remaining sources are still loading.
+        
+        Returns:
+            All ingested documents, the merged entities and the summed graph counts
+        """
+        documents: List[Document] = []
+        entities: Dict[str, Any] = {}
+        kg_results: Dict[str, int] = {}
+        extract_queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        kg_queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        
+        async def produce():
+            batches = self.ingestor.iter_batch_ingest(sources)
+            try:
+                async for batch in batches:
+                    documents.extend(batch)
+                    await extract_queue.put(batch)
+                    await kg_queue.put(batch)
+            finally:
+                # Close the generator now, so it cancels its outstanding source tasks
+                await batches.aclose()
+            # Sentinels tell both consumers that ingestion is over
+            await extract_queue.put(None)
+            await kg_queue.put(None)
+        
+        async def extract():
+            while (batch := await extract_queue.get()) is not None:
+                found = await asyncio.to_thread(self.extractor.extract_political_entities, batch)
+                for entity_type, items in found.items():
+                    entities.setdefault(entity_type, []).extend(items)
+        
+        async def build_graph():
+            while (batch := await kg_queue.get()) is not None:
+                counts = await asyncio.to_thread(self.kg.build_from_documents, batch)
+                for key, count in counts.items():
+                    kg_results[key] = kg_results.get(key, 0) + count
+        
+        tasks = [asyncio.ensure_future(stage) for stage in (produce(), extract(), build_graph())]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            # Let the stages (and the ingestion generator's cleanup) finish cancelling
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        
+        return documents, entities, kg_results
+    
     async def run_targeted_analysis(self, question: str, context_sources: Dict[str, Any] = None) -> str:
         """
         Run a targeted analysis to answer a specific political question
@@ -107,17 +233,30 @@ class PoliticalAnalysisOrchestrator:
         logger.info(f"Running targeted analysis for question: {question}")
         
         try:
+            # Questions without extra context can be answered from earlier
+            # answers to the same or a closely paraphrased question
+            vector = None
+            if not context_sources:
+                cached_answer, vector = await self._qa_cache.lookup(question)
+                if cached_answer is not None:
+                    logger.info("Targeted analysis answered from cache")
+                    return cached_answer
+            
             # If context sources provided, ingest them first
             context_documents = []
             if context_sources:
-                context_documents = self.ingestor.batch_ingest(context_sources)
+                context_documents = await self.ingestor.batch_ingest(context_sources)
             
             # Initialize agent if not already done
             if not self.agent.agent:
                 await self.agent.initialize_agent()
             
             # Answer the question
-            answer = await self.agent.answer_question(question, str(context_documents[:2]))
+            # Failures raise rather than come back as an answer, so they are never cached
+            answer = await self.agent.answer_question(question, str(context_documents[:2]), raise_errors=True)
+            
+            if not context_sources:
+                self._qa_cache.add(question, vector, answer)
             
             logger.info("Targeted analysis completed")
             return answer
@@ -138,7 +277,6 @@ class PoliticalAnalysisOrchestrator:
             True if successful, False otherwise
         """
         try:
-            import json
             from datetime import datetime
             
             # Generate output path if not provided
@@ -149,9 +287,16 @@ class PoliticalAnalysisOrchestrator:
             # Ensure output directory exists
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             
-            # Save results
-            with open(output_path, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            # Encode in one go and save with a single write
+            if orjson is not None:
+                data = orjson.dumps(
+                    results,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                )
+            else:
+                data = json.dumps(results, indent=2, default=str).encode("utf-8")
+            Path(output_path).write_bytes(data)
             
             logger.info(f"Results saved to {output_path}")
             return True
@@ -3,6 +3,8 @@ Web Crawling Configuration for Political Document Analysis System
 Defines specific configurations for crawling political websites
 """
 
+from enum import IntEnum
+
 # Political websites to crawl
 POLITICAL_WEBSITES = [
     # Government websites
@@ -89,32 +91,40 @@ ENTITY_EXTRACTION_CONFIG = {
 }
 
 # Knowledge graph relationship types
-RELATIONSHIP_TYPES = [
-    "SPONSORS",           # Politician sponsors legislation
-    "SUPPORTS",           # Politician/party supports policy
-    "OPPOSES",            # Politician/party opposes policy
-    "MEMBER_OF",          # Politician is member of party
-    "VOTES_FOR",          # Politician votes for legislation
-    "VOTES_AGAINST",      # Politician votes against legislation
-    "ATTENDS",            # Politician attends event
-    "MENTIONS",           # Document mentions entity
-    "RELATED_TO",         # General relationship
-    "PART_OF",            # Entity is part of larger entity
-]
+class RelType(IntEnum):
+    SPONSORS = 0          # Politician sponsors legislation
+    SUPPORTS = 1          # Politician/party supports policy
+    OPPOSES = 2           # Politician/party opposes policy
+    MEMBER_OF = 3         # Politician is member of party
+    VOTES_FOR = 4         # Politician votes for legislation
+    VOTES_AGAINST = 5     # Politician votes against legislation
+    ATTENDS = 6           # Politician attends event
+    MENTIONS = 7          # Document mentions entity
+    RELATED_TO = 8        # General relationship
+    PART_OF = 9           # Entity is part of larger entity
+
 
 # Analysis categories
-POLITICAL_CATEGORIES = [
-    "Domestic Policy",
-    "Foreign Policy",
-    "Economic Policy",
-    "Social Policy",
-    "Environmental Policy",
-    "Healthcare Policy",
-    "Education Policy",
-    "Defense Policy",
-    "Immigration Policy",
-    "Tax Policy",
-]
+class PolicyCat(IntEnum):
+    DOMESTIC = 0
+    FOREIGN = 1
+    ECONOMIC = 2
+    SOCIAL = 3
+    ENVIRONMENTAL = 4
+    HEALTHCARE = 5
+    EDUCATION = 6
+    DEFENSE = 7
+    IMMIGRATION = 8
+    TAX = 9
+    
+    @property
+    def label(self) -> str:
+        return f"{self.name.title()} Policy"
+
+
+# Name lists kept for code that works with the labels directly
+RELATIONSHIP_TYPES = [rel_type.name for rel_type in RelType]
+POLITICAL_CATEGORIES = [category.label for category in PolicyCat]
 
 if __name__ == "__main__":
     print("Political Web Crawling Configuration")
@@ -3,30 +3,313 @@ Document Ingestion Module for Political Document Analysis System
 Handles loading and preprocessing of political documents from various sources
 """
 
+import asyncio
+import hashlib
+import json
 import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Union, Dict, Any
-from llama_index.core import SimpleDirectoryReader
+from typing import AsyncIterator, List, Optional, Tuple, Union, Dict, Any
+from urllib.parse import urlsplit, urlunsplit
+from xml.etree import ElementTree
+from llama_index.core import Document, SimpleDirectoryReader
 from llama_index.readers.web import (
     SpiderWebReader,
     WholeSiteReader,
     RSSNewsReader,
-    SitemapReader
+    SitemapReader,
+    AsyncWebPageReader
 )
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 import logging
 
+try:
+    import xxhash
+except ImportError:  # optional: faster content hashing
+    xxhash = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on worker processes parsing local documents
+_LOAD_WORKERS = 8
+
+# Upper bound on RSS feeds downloaded at the same time
+_RSS_FETCH_WORKERS = 8
+
+# Chunk size used when streaming downloads to disk
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Upper bound on files downloaded at the same time by download_files()
+_DOWNLOAD_WORKERS = 16
+
+# Per-user directory for downloaded files (kept with their validators for conditional
+# re-fetches) and parsed local documents
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "political_ingestor"
+
+# Least recently fetched bodies are evicted once the URL cache grows past this size
+URL_CACHE_MAX_BYTES = 1024 ** 3
+
+# Paths looked up per parse cache query, below SQLite's bound-parameter limit
+_SQL_PARAMS_PER_QUERY = 500
+
+# Metadata keys web readers use for the URL a document was fetched from
+_URL_METADATA_KEYS = ("url", "URL", "source", "Source")
+
+
+def _document_fingerprint(document: Any) -> bytes:
+    """Digest of a document's whitespace-normalized text, used to drop duplicates"""
+    data = " ".join(document.text.split()).encode("utf-8", "surrogatepass")
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(data)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _normalize_url(url: str) -> str:
+    """Canonical form of a URL for visited checks: lowercase scheme and host, no trailing slash or fragment"""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), parts.query, ""))
+
+
+def _sitemap_urls(sitemap: bytes) -> List[str]:
+    """Page URLs listed in the <url><loc> entries of a sitemap.xml document"""
+    urls = []
+    for element in ElementTree.fromstring(sitemap).iter():
+        # Sitemaps are namespaced, so match on the local tag name
+        if element.tag.rsplit("}", 1)[-1] == "url":
+            for child in element:
+                if child.tag.rsplit("}", 1)[-1] == "loc" and child.text:
+                    urls.append(child.text.strip())
+    return urls
+
+
+def _drop_duplicates(documents: List[Any], seen: set) -> List[Any]:
+    """Keep the documents whose text has not been seen yet, recording their fingerprints"""
+    unique = []
+    for document in documents:
+        fingerprint = _document_fingerprint(document)
+        if fingerprint not in seen:
+            seen.add(fingerprint)
+            unique.append(document)
+    return unique
+
+
+class URLCache:
+    """Persistent cache of downloaded URLs keyed by URL, revalidated with ETag / Last-Modified"""
+    
+    def __init__(self, cache_dir: Union[str, Path] = CACHE_DIR, max_bytes: int = URL_CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.bodies_dir = self.cache_dir / "bodies"
+        self.bodies_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.cache_dir / "urls.db"
+        
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.index_file, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS urls ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body_path TEXT, fetched_at REAL)"
+        )
+        return conn
+    
+    def body_path(self, url: str) -> Path:
+        """Return where the cached body of a URL is stored"""
+        return self.bodies_dir / hashlib.sha256(url.encode()).hexdigest()
+    
+    def get(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], Path]]:
+        """Return ``(etag, last_modified, body_path)`` for a cached URL, if its body is still on disk"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified, body_path FROM urls WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None or not os.path.exists(row[2]):
+            return None
+        return row[0], row[1], Path(row[2])
+    
+    def conditional_headers(self, entry: Optional[Tuple[Optional[str], Optional[str], Path]]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from a cache entry"""
+        headers = {}
+        if entry is not None:
+            etag, last_modified, _ = entry
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        return headers
+    
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str], source: Union[str, Path]) -> None:
+        """Cache a downloaded file along with the validators the server sent for it"""
+        body_path = self.body_path(url)
+        # Write beside the final path and rename, so concurrent readers never see a partial body
+        fd, tmp_path = tempfile.mkstemp(dir=self.bodies_dir, prefix=".tmp-")
+        try:
+            with open(fd, "wb") as dst, open(source, "rb") as src:
+                shutil.copyfileobj(src, dst, length=_DOWNLOAD_CHUNK_SIZE)
+            os.replace(tmp_path, body_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO urls VALUES (?, ?, ?, ?, strftime('%s', 'now'))",
+                (url, etag, last_modified, str(body_path))
+            )
+        self._evict()
+    
+    def _evict(self) -> None:
+        """Drop the least recently fetched bodies until the cache fits in max_bytes"""
+        with os.scandir(self.bodies_dir) as entries:
+            sizes = {entry.path: entry.stat().st_size for entry in entries if entry.is_file()}
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+        with closing(self._connect()) as conn, conn:
+            rows = conn.execute("SELECT url, body_path FROM urls ORDER BY fetched_at").fetchall()
+            for url, body_path in rows:
+                if total <= self.max_bytes:
+                    break
+                conn.execute("DELETE FROM urls WHERE url = ?", (url,))
+                try:
+                    os.unlink(body_path)
+                except OSError:
+                    continue
+                total -= sizes.get(body_path, 0)
+
+
+class ParseCache:
+    """Persistent cache of parsed local files keyed by path, invalidated by mtime and size"""
+    
+    def __init__(self, cache_dir: Union[str, Path] = CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.cache_dir / "parsed.db"
+        
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.index_file, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS parsed ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, documents TEXT)"
+        )
+        return conn
+    
+    def partition(self, files: Dict[str, os.stat_result]) -> Tuple[Dict[str, List[Any]], List[str]]:
+        """Split ``{path: stat}`` into the documents of unchanged files and the paths to parse"""
+        paths = list(files)
+        unchanged = set()
+        cached = {}
+        with closing(self._connect()) as conn:
+            # Compare mtime and size first, then decode the documents of unchanged files only
+            for start in range(0, len(paths), _SQL_PARAMS_PER_QUERY):
+                chunk = paths[start:start + _SQL_PARAMS_PER_QUERY]
+                rows = conn.execute(
+                    f"SELECT path, mtime_ns, size FROM parsed WHERE path IN ({','.join('?' * len(chunk))})",
+                    chunk
+                )
+                unchanged.update(
+                    path for path, mtime_ns, size in rows
+                    if mtime_ns == files[path].st_mtime_ns and size == files[path].st_size
+                )
+            matched = [path for path in paths if path in unchanged]
+            for start in range(0, len(matched), _SQL_PARAMS_PER_QUERY):
+                chunk = matched[start:start + _SQL_PARAMS_PER_QUERY]
+                rows = conn.execute(
+                    f"SELECT path, documents FROM parsed WHERE path IN ({','.join('?' * len(chunk))})",
+                    chunk
+                )
+                cached.update(
+                    (path, [Document.from_dict(data) for data in json.loads(documents)])
+                    for path, documents in rows
+                )
+        return cached, [path for path in paths if path not in cached]
+    
+    def store(self, parsed: Dict[str, List[Any]], files: Dict[str, os.stat_result]) -> None:
+        """Cache the documents parsed from each file along with the file's mtime and size"""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO parsed VALUES (?, ?, ?, ?)",
+                [
+                    (path, files[path].st_mtime_ns, files[path].st_size,
+                     json.dumps([document.to_dict() for document in documents]))
+                    for path, documents in parsed.items()
+                ]
+            )
+
+
+def _scan_files(directory: Path, extensions: set) -> Dict[str, os.stat_result]:
+    """Stat every non-hidden file with one of the given extensions under a directory"""
+    files = {}
+    pending = [directory]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    pending.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in extensions:
+                    files[os.path.abspath(entry.path)] = entry.stat()
+    return files
+
+
+class VisitedURLs:
+    """Pages loaded so far by the website crawls and sitemaps of one batch"""
+    
+    def __init__(self):
+        self._urls = set()
+        self._lock = threading.Lock()
+        
+    def claim(self, urls: List[str]) -> List[str]:
+        """Keep the URLs that have not been loaded yet, recording them as loaded"""
+        kept = []
+        with self._lock:
+            for url in urls:
+                normalized = _normalize_url(url)
+                if normalized not in self._urls:
+                    self._urls.add(normalized)
+                    kept.append(url)
+        return kept
+    
+    def filter(self, documents: List[Any]) -> List[Any]:
+        """Keep the web documents whose URL has not been loaded yet, recording their URLs"""
+        kept = []
+        with self._lock:
+            for document in documents:
+                metadata = getattr(document, "metadata", None) or {}
+                url = next((metadata[key] for key in _URL_METADATA_KEYS if metadata.get(key)), None)
+                if url is not None:
+                    url = _normalize_url(url)
+                    if url in self._urls:
+                        continue
+                    self._urls.add(url)
+                kept.append(document)
+        return kept
+
+
 class PoliticalDocumentIngestor:
     """Handles ingestion of political documents from various sources"""
     
-    def __init__(self, config):
+    def __init__(self, config, use_parse_cache: bool = True):
         self.config = config
         self.supported_formats = config.SUPPORTED_FORMATS
+        self._url_cache = None
+        self._use_parse_cache = use_parse_cache
+        self._parse_cache = None
+        
+        # One session so downloads reuse pooled keep-alive connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         
     def load_local_documents(self, directory_path: Union[str, Path]) -> List[Dict[str, Any]]:
         """
@@ -41,28 +324,49 @@ class PoliticalDocumentIngestor:
         logger.info(f"Loading documents from {directory_path}")
         
         try:
-            reader = SimpleDirectoryReader(
-                input_dir=str(directory_path),
-                filename_as_id=True,
-                recursive=True,
-                required_exts=[f".{ext}" for ext in self.supported_formats]
-            )
-            documents = reader.load_data()
+            files = _scan_files(Path(directory_path), {f".{ext}" for ext in self.supported_formats})
+            if self._use_parse_cache and self._parse_cache is None:
+                self._parse_cache = ParseCache()
+            if self._parse_cache is not None:
+                cached, to_parse = self._parse_cache.partition(files)
+            else:
+                cached, to_parse = {}, list(files)
+            
+            parsed = {}
+            if to_parse:
+                reader = SimpleDirectoryReader(input_files=to_parse, filename_as_id=True)
+                # Parse files (PDF/DOCX parsing is CPU-bound) in a pool of worker processes
+                num_workers = min(os.cpu_count() or 1, _LOAD_WORKERS, len(to_parse))
+                for document in reader.load_data(num_workers=num_workers):
+                    parsed.setdefault(os.path.abspath(document.metadata["file_path"]), []).append(document)
+                if self._parse_cache is not None:
+                    self._parse_cache.store(parsed, files)
             
-            logger.info(f"Loaded {len(documents)} documents from {directory_path}")
+            documents = [
+                document
+                for path in files
+                for document in cached.get(path, parsed.get(path, ()))
+            ]
+            
+            logger.info(
+                f"Loaded {len(documents)} documents from {directory_path} "
+                f"({len(to_parse)} of {len(files)} files parsed)"
+            )
             return documents
             
         except Exception as e:
             logger.error(f"Error loading documents from {directory_path}: {str(e)}")
             return []
     
-    def crawl_website(self, base_url: str, max_depth: int = None) -> List[Dict[str, Any]]:
+    def crawl_website(self, base_url: str, max_depth: int = None,
+                      visited: Optional[VisitedURLs] = None) -> List[Dict[str, Any]]:
         """
         Crawl a political website to extract documents
         
         Args:
             base_url: Base URL of the website to crawl
             max_depth: Maximum depth to crawl (None for config default)
+            visited: Pages already loaded by other sources of the batch, to skip
             
         Returns:
             List of document dictionaries with content and metadata
@@ -79,6 +383,10 @@ class PoliticalDocumentIngestor:
                 depth=max_depth,
                 max_pages=self.config.MAX_CRAWL_PAGES
             )
+            if visited is not None:
+                # The crawler fetches pages itself, so overlap can only be dropped afterwards;
+                # recording its URLs still lets sitemaps that run later skip those pages
+                documents = visited.filter(documents)
             
             logger.info(f"Crawled {len(documents)} pages from {base_url}")
             return documents
@@ -103,13 +411,15 @@ class PoliticalDocumentIngestor:
             reader = RSSNewsReader()
             documents = []
             
-            for url in tqdm(rss_urls, desc="Processing RSS feeds"):
-                try:
-                    feed_docs = reader.load_data(url=url)
-                    documents.extend(feed_docs)
-                except Exception as e:
-                    logger.warning(f"Error loading RSS feed {url}: {str(e)}")
-                    continue
+            # Fetch all feeds concurrently; results are collected in feed order
+            with ThreadPoolExecutor(max_workers=max(1, min(len(rss_urls), _RSS_FETCH_WORKERS))) as executor:
+                futures = [executor.submit(reader.load_data, url=url) for url in rss_urls]
+                for url, future in tqdm(zip(rss_urls, futures), total=len(futures), desc="Processing RSS feeds"):
+                    try:
+                        documents.extend(future.result())
+                    except Exception as e:
+                        logger.warning(f"Error loading RSS feed {url}: {str(e)}")
+                        continue
             
             logger.info(f"Loaded {len(documents)} articles from RSS feeds")
             return documents
@@ -118,12 +428,13 @@ class PoliticalDocumentIngestor:
             logger.error(f"Error loading RSS feeds: {str(e)}")
             return []
     
-    def load_sitemap(self, sitemap_url: str) -> List[Dict[str, Any]]:
+    def load_sitemap(self, sitemap_url: str, visited: Optional[VisitedURLs] = None) -> List[Dict[str, Any]]:
         """
         Load documents from a website sitemap
         
         Args:
             sitemap_url: URL of the sitemap.xml file
+            visited: Pages already loaded by other sources of the batch, to skip
             
         Returns:
             List of document dictionaries with content and metadata
@@ -131,8 +442,17 @@ class PoliticalDocumentIngestor:
         logger.info(f"Loading documents from sitemap: {sitemap_url}")
         
         try:
-            reader = SitemapReader()
-            documents = reader.load_data(sitemap_url=sitemap_url)
+            if visited is None:
+                reader = SitemapReader()
+                documents = reader.load_data(sitemap_url=sitemap_url)
+            else:
+                # Read the sitemap here so pages other sources already loaded are never fetched
+                response = self._session.get(sitemap_url, timeout=30)
+                response.raise_for_status()
+                urls = _sitemap_urls(response.content)
+                new_urls = visited.claim(urls)
+                documents = AsyncWebPageReader().load_data(urls=new_urls) if new_urls else []
+                logger.info(f"Skipped {len(urls) - len(new_urls)} sitemap pages already loaded in this batch")
             
             logger.info(f"Loaded {len(documents)} documents from sitemap")
             return documents
@@ -153,11 +473,34 @@ class PoliticalDocumentIngestor:
             True if successful, False otherwise
         """
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+            if self._url_cache is None:
+                self._url_cache = URLCache()
+            cached = self._url_cache.get(url)
             
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
+            headers = self._url_cache.conditional_headers(cached)
+            with self._session.get(url, timeout=30, headers=headers, stream=True) as response:
+                # Unchanged since the last download: reuse the cached body
+                if response.status_code == 304 and cached is not None:
+                    try:
+                        shutil.copyfile(cached[2], save_path)
+                    except FileNotFoundError:
+                        # Evicted since the lookup, so get() now misses and the retry is unconditional
+                        return self.download_file(url, save_path)
+                    logger.info(f"{url} not modified, copied cached body to {save_path}")
+                    return True
+                
+                response.raise_for_status()
+                
+                # Stream to disk in fixed-size chunks instead of holding the whole file in memory
+                response.raw.decode_content = True
+                with open(save_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=_DOWNLOAD_CHUNK_SIZE)
+                
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+            
+            if etag or last_modified:
+                self._url_cache.store(url, etag, last_modified, save_path)
                 
             logger.info(f"Downloaded {url} to {save_path}")
             return True
@@ -166,57 +509,129 @@ class PoliticalDocumentIngestor:
             logger.error(f"Error downloading {url}: {str(e)}")
             return False
     
-    def batch_ingest(self, sources: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def download_files(self, downloads: Dict[str, Union[str, Path]]) -> Dict[str, bool]:
         """
-        Ingest documents from multiple sources in batch
+        Download several political documents concurrently over the shared session
         
         Args:
-            sources: Dictionary with source types and configurations
-                {
-                    "local_directories": ["/path/to/docs1", "/path/to/docs2"],
-                    "websites": ["https://example.gov", "https://news.example.com"],
-                    "rss_feeds": ["https://example.com/rss", "https://news.example.com/feed"],
-                    "sitemaps": ["https://example.gov/sitemap.xml"]
-                }
-                
+            downloads: Mapping of document URL to the path where it should be saved
+            
         Returns:
-            List of all ingested documents
+            Mapping of each URL to whether its download succeeded
         """
-        all_documents = []
+        if not downloads:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(len(downloads), _DOWNLOAD_WORKERS)) as executor:
+            results = executor.map(self.download_file, downloads.keys(), downloads.values())
+            return dict(zip(downloads, results))
+    
+    def _source_tasks(self, sources: Dict[str, Any]) -> List[Any]:
+        """Build one worker-thread coroutine per source to ingest"""
+        # Pages shared between websites and sitemaps are only kept once per batch
+        visited = VisitedURLs()
+        tasks = []
         
         # Load local documents
         if "local_directories" in sources:
             for directory in sources["local_directories"]:
-                documents = self.load_local_documents(directory)
-                all_documents.extend(documents)
+                tasks.append(asyncio.to_thread(self.load_local_documents, directory))
         
         # Crawl websites
         if "websites" in sources:
             for website in sources["websites"]:
-                documents = self.crawl_website(website)
-                all_documents.extend(documents)
+                tasks.append(asyncio.to_thread(self.crawl_website, website, visited=visited))
         
         # Load RSS feeds
         if "rss_feeds" in sources:
-            documents = self.load_rss_feeds(sources["rss_feeds"])
-            all_documents.extend(documents)
+            tasks.append(asyncio.to_thread(self.load_rss_feeds, sources["rss_feeds"]))
         
         # Load sitemaps
         if "sitemaps" in sources:
             for sitemap in sources["sitemaps"]:
-                documents = self.load_sitemap(sitemap)
-                all_documents.extend(documents)
+                tasks.append(asyncio.to_thread(self.load_sitemap, sitemap, visited=visited))
+        
+        return tasks
+    
+    async def batch_ingest(self, sources: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Ingest documents from multiple sources in batch
+        
+        Every source is loaded in a worker thread and all of them run
+        concurrently, so the batch takes about as long as the slowest source.
+        
+        Args:
+            sources: Dictionary with source types and configurations
+                {
+                    "local_directories": ["/path/to/docs1", "/path/to/docs2"],
+                    "websites": ["https://example.gov", "https://news.example.com"],
+                    "rss_feeds": ["https://example.com/rss", "https://news.example.com/feed"],
+                    "sitemaps": ["https://example.gov/sitemap.xml"]
+                }
+                
+        Returns:
+            List of all ingested documents, without duplicates
+        """
+        tasks = self._source_tasks(sources)
+        
+        all_documents = []
+        seen = set()
+        for documents in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(documents, Exception):
+                logger.error(f"Error ingesting source: {str(documents)}")
+                continue
+            # The same article is often reachable from several sources
+            all_documents.extend(_drop_duplicates(documents, seen))
         
         logger.info(f"Batch ingestion completed. Total documents: {len(all_documents)}")
         return all_documents
+    
+    async def iter_batch_ingest(self, sources: Dict[str, Any]) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Ingest documents from multiple sources, yielding each source's documents as soon as it finishes
+        
+        Sources are loaded concurrently as in batch_ingest(), but downstream
+        stages can start on the first source instead of waiting for the slowest.
+        
+        Args:
+            sources: Dictionary with source types and configurations (see batch_ingest)
+            
+        Yields:
+            The (non-empty) list of new documents of each source, in completion order
+        """
+        total = 0
+        seen = set()
+        tasks = [asyncio.ensure_future(task) for task in self._source_tasks(sources)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                try:
+                    documents = await task
+                except Exception as e:
+                    logger.error(f"Error ingesting source: {str(e)}")
+                    continue
+                documents = _drop_duplicates(documents, seen)
+                if documents:
+                    total += len(documents)
+                    yield documents
+        finally:
+            # Stop waiting on sources nobody will consume when iteration is abandoned
+            for task in tasks:
+                task.cancel()
+        
+        logger.info(f"Batch ingestion completed. Total documents: {total}")
 
 # Example usage
 if __name__ == "__main__":
     # Import configuration
     from political_analysis_init import config
     
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Ingest political documents")
+    parser.add_argument("--no-cache", action="store_true", help="re-parse every local file")
+    args = parser.parse_args()
+    
     # Initialize ingestor
-    ingestor = PoliticalDocumentIngestor(config)
+    ingestor = PoliticalDocumentIngestor(config, use_parse_cache=not args.no_cache)
     
     # Example sources for political documents
     sources = {
@@ -235,5 +650,5 @@ if __name__ == "__main__":
     }
     
     # Perform batch ingestion
-    documents = ingestor.batch_ingest(sources)
+    documents = asyncio.run(ingestor.batch_ingest(sources))
     print(f"Ingested {len(documents)} political documents")
\ No newline at end of file
@@ -19,8 +19,6 @@ import logging
 from pydantic import BaseModel, Field
 from typing import Optional
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Define Pydantic models for political entities
@@ -278,6 +276,8 @@ class PoliticalEntityExtractor:
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Import configuration
     from political_analysis_init import config
     
@@ -88,7 +88,7 @@ class PoliticalDocumentIngestionPipeline:
         
         # Run ingestion
         print("\n2. Running document ingestion...")
-        documents = self.ingestor.batch_ingest(sources)
+        documents = await self.ingestor.batch_ingest(sources)
         
         if not documents:
             print("❌ No documents were ingested.")
@@ -15,8 +15,6 @@ from llama_index.core.indices.property_graph import PropertyGraphIndex
 from llama_index.llms.openai import OpenAI
 from llama_index.embeddings.openai import OpenAIEmbedding
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class PoliticalKnowledgeGraph:
@@ -164,29 +162,34 @@ class PoliticalKnowledgeGraph:
             
         relationships_created = 0
         
-        for rel_data in relationships:
-            try:
-                # Parse relationship data (simplified)
-                source = rel_data.get("source", "Unknown")
-                target = rel_data.get("target", "Unknown")
-                rel_type = rel_data.get("relationship_type", "RELATED_TO")
-                strength = rel_data.get("strength", 0.5)
-                
-                # Create relationship in Neo4j
-                query = """
-                MATCH (a), (b)
-                WHERE a.name = $source AND b.name = $target
-                MERGE (a)-[r:%s {strength: $strength}]->(b)
-                RETURN r
-                """ % rel_type.upper().replace(" ", "_")
-                
-                with self.graph_store.client.session() as session:
-                    result = session.run(query, source=source, target=target, strength=strength)
-                    relationships_created += 1
-                    
-            except Exception as e:
-                logger.warning(f"Error creating relationship: {str(e)}")
-                continue
+        # One session (and pooled connection) for the whole batch rather than one per relationship
+        try:
+            with self.graph_store.client.session() as session:
+                for rel_data in relationships:
+                    try:
+                        # Parse relationship data (simplified)
+                        source = rel_data.get("source", "Unknown")
+                        target = rel_data.get("target", "Unknown")
+                        rel_type = rel_data.get("relationship_type", "RELATED_TO")
+                        strength = rel_data.get("strength", 0.5)
+                        
+                        # Create relationship in Neo4j
+                        query = """
+                        MATCH (a), (b)
+                        WHERE a.name = $source AND b.name = $target
+                        MERGE (a)-[r:%s {strength: $strength}]->(b)
+                        RETURN r
+                        """ % rel_type.upper().replace(" ", "_")
+                        
+                        result = session.run(query, source=source, target=target, strength=strength)
+                        relationships_created += 1
+                        
+                    except Exception as e:
+                        logger.warning(f"Error creating relationship: {str(e)}")
+                        continue
+        except Exception as e:
+            # The session itself failed (e.g. the driver lost its connection)
+            logger.warning(f"Error creating relationship: {str(e)}")
         
         logger.info(f"Created {relationships_created} relationships in knowledge graph")
         return relationships_created
@@ -261,9 +264,10 @@ class PoliticalKnowledgeGraph:
         # natural language to Cypher. For now, we'll return a placeholder.
         
         # Example conversion logic:
-        if "politicians" in query.lower() and "party" in query.lower():
+        query = query.lower()
+        if "politicians" in query and "party" in query:
             return "MATCH (p:Politician)-[:MEMBER_OF]->(pp:PoliticalParty) RETURN p.name, pp.name"
-        elif "legislation" in query.lower() and "sponsor" in query.lower():
+        elif "legislation" in query and "sponsor" in query:
             return "MATCH (p:Politician)-[:SPONSORS]->(l:Legislation) RETURN p.name, l.title"
         else:
             # Default query
@@ -319,6 +323,8 @@ class PoliticalKnowledgeGraph:
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Import configuration
     from political_analysis_init import config
     
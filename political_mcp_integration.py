@@ -9,10 +9,11 @@ from typing import List, Dict, Any, Optional, Union
 from llama_index.tools.mcp import BasicMCPClient, McpToolSpec
 from llama_index.core.tools import BaseTool
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on MCP servers being connected to at the same time
+MAX_CONCURRENT_CONNECTIONS = 8
+
 class PoliticalMCPIntegration:
     """Manages integration with MCP servers for political analysis tools"""
     
@@ -120,20 +121,26 @@ class PoliticalMCPIntegration:
             "media_bias": "http://localhost:8005"
         }
         
-        server_tools = {}
-        
-        # Register and connect to each server
-        for name, url in political_servers.items():
-            try:
-                # Register server
-                if self.register_mcp_server(name, url):
-                    # Load tools
-                    tools = await self.load_mcp_tools(name)
-                    server_tools[name] = tools
-                    
-            except Exception as e:
-                logger.warning(f"Error connecting to {name} MCP server: {str(e)}")
-                continue
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONNECTIONS)
+        
+        async def connect(name: str, url: str) -> Optional[List[BaseTool]]:
+            async with semaphore:
+                try:
+                    # Register server
+                    if self.register_mcp_server(name, url):
+                        # Load tools
+                        return await self.load_mcp_tools(name)
+                except Exception as e:
+                    logger.warning(f"Error connecting to {name} MCP server: {str(e)}")
+                return None
+        
+        # Register and connect to all servers concurrently
+        results = await asyncio.gather(*(connect(name, url) for name, url in political_servers.items()))
+        server_tools = {
+            name: tools
+            for name, tools in zip(political_servers, results)
+            if tools is not None
+        }
         
         logger.info(f"Connected to {len(server_tools)} political MCP servers")
         return server_tools
@@ -236,6 +243,8 @@ class LegislativeTrackingTool:
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Import configuration
     from political_analysis_init import config
     
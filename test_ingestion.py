@@ -70,7 +70,7 @@ async def run_test_ingestion():
     
     # Run ingestion
     print("\n4. Running document ingestion...")
-    documents = ingestor.batch_ingest(test_sources)
+    documents = await ingestor.batch_ingest(test_sources)
     
     if not documents:
         print("❌ No documents were ingested. Check the sources and try again.")
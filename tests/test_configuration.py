@@ -621,4 +621,44 @@ class TestWebInterfaceConfiguration:
         loaded = config_manager.load_config("web_interface_advanced")
         assert loaded["authentication"]["enabled"] is True
         assert "oauth" in loaded["authentication"]["providers"]
-        assert loaded["permissions"]["analyst"] == ["search", "analytics", "data_export"]
\ No newline at end of file
+        assert loaded["permissions"]["analyst"] == ["search", "analytics", "data_export"]
+
+
+class TestConfigurationCaching:
+    """Test configuration file caching."""
+    
+    @pytest.fixture
+    def config_manager(self, temp_dir: Path):
+        """Create the real configuration manager with temporary directory."""
+        from llama_political_manager.config_manager import ConfigurationManager
+        return ConfigurationManager(temp_dir / "config")
+    
+    def test_repeated_loads_use_cache(self, config_manager):
+        """Test that unchanged files are not re-parsed."""
+        config_manager.save_config("cached", {"value": 1})
+        
+        first = config_manager.load_config("cached")
+        second = config_manager.load_config("cached")
+        assert first is second
+        
+    def test_external_edit_invalidates_cache(self, config_manager):
+        """Test that a file edited on disk is reloaded."""
+        config_manager.save_config("cached", {"value": 1})
+        assert config_manager.load_config("cached") == {"value": 1}
+        
+        config_file = config_manager.config_dir / "cached.json"
+        config_file.write_text(json.dumps({"value": 22}))
+        
+        assert config_manager.load_config("cached") == {"value": 22}
+        
+    def test_unchanged_update_skips_write(self, config_manager):
+        """Test that an update matching the saved config does not rewrite it."""
+        config_manager.update_config("deployment", {"port": 9000})
+        config_file = config_manager.config_dir / "deployment.json"
+        mtime_ns = config_file.stat().st_mtime_ns
+        
+        config_manager.update_config("deployment", {"port": 9000})
+        assert config_file.stat().st_mtime_ns == mtime_ns
+        
+        config_manager.update_config("deployment", {"port": 9001})
+        assert json.loads(config_file.read_text())["port"] == 9001
@@ -0,0 +1,205 @@
+"""
+Test suite for the document ingestion scripts and helpers.
+This includes tests for the job queue, saved output and ingestion caches.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import tarfile
+from contextlib import closing
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+
+class TestIngestionQueue:
+    """Test the ingestion job queue and its index."""
+    
+    @pytest.fixture
+    def queue(self, temp_dir: Path, monkeypatch):
+        """Point the job queue at a temporary jobs directory."""
+        import ingestion_queue
+        monkeypatch.setattr(ingestion_queue, "JOBS_DIR", temp_dir / "jobs")
+        monkeypatch.setattr(ingestion_queue, "_reconciled_dirs", set())
+        return ingestion_queue
+        
+    def test_jobs_claimed_by_priority(self, queue):
+        """Test that pending jobs are claimed highest priority first, each once."""
+        queue.create_ingestion_job({}, "low_job", priority="low")
+        queue.create_ingestion_job({}, "high_job", priority="high")
+        queue.create_ingestion_job({}, "normal_job")
+        
+        claimed = []
+        while (job_file := queue._claim_next_job(queue.JOBS_DIR)) is not None:
+            claimed.append(job_file.name)
+            
+        assert claimed == ["high_job.json", "normal_job.json", "low_job.json"]
+        assert not queue._claim_job(queue.JOBS_DIR / "high_job.json")
+        
+    def test_index_reconciled_on_startup(self, queue):
+        """Test that job files added or removed behind the index's back are picked up."""
+        queue.create_ingestion_job({}, "removed")
+        queue.create_ingestion_job({}, "claimed")
+        assert queue._claim_job(queue.JOBS_DIR / "claimed.json")
+        
+        (queue.JOBS_DIR / "removed.json").unlink()
+        (queue.JOBS_DIR / "added.json").write_text(json.dumps({
+            "job_name": "added", "priority": "high", "status": "pending", "created_at": "", "sources": {}
+        }))
+        
+        # A new process reconciles the index on its first connection
+        queue._reconciled_dirs.clear()
+        assert [job_file.name for job_file in queue.list_pending_jobs()] == ["added.json"]
+        assert not queue._claim_job(queue.JOBS_DIR / "claimed.json")
+
+
+class TestSavedDocuments:
+    """Test documents saved by the full ingestion pipeline."""
+    
+    @pytest.fixture
+    def documents(self):
+        """Create documents with the attributes the pipeline saves."""
+        return [
+            SimpleNamespace(doc_id=f"doc/{i}", text=f"Bill {i} text é", metadata={"index": i})
+            for i in range(5)
+        ]
+        
+    @pytest.mark.asyncio
+    async def test_tar_members_match_files(self, documents, temp_dir: Path):
+        """Test that the tar format stores the same names and bytes as the files format."""
+        from full_ingestion_pipeline import _full_ingestion_filename, save_documents
+        
+        files_dir = temp_dir / "files"
+        files_dir.mkdir()
+        await save_documents(documents, files_dir, _full_ingestion_filename, batch_size=2)
+        archive = await save_documents(documents, temp_dir, _full_ingestion_filename, output_format="tar")
+        
+        with tarfile.open(archive) as tf:
+            members = {member.name: tf.extractfile(member).read() for member in tf.getmembers()}
+        assert members == {path.name: path.read_bytes() for path in files_dir.iterdir()}
+        
+        saved = (files_dir / "document_002_doc_1.txt").read_text(encoding="utf-8")
+        assert saved.startswith("Document ID: doc/1\nMetadata: ")
+        assert saved.endswith("-" * 50 + "\nBill 1 text é")
+        
+    def test_short_writev_is_completed(self, documents, temp_dir: Path, monkeypatch):
+        """Test that a document is written in full when writev only writes part of it."""
+        from full_ingestion_pipeline import _document_parts, _write_document
+        
+        real_write = os.write
+        monkeypatch.setattr(os, "writev", lambda fd, buffers: real_write(fd, buffers[0][:3]), raising=False)
+        
+        path = temp_dir / "doc.txt"
+        _write_document(str(path), documents[0])
+        assert path.read_bytes() == b"".join(_document_parts(documents[0]))
+
+
+class TestCrawlingEnums:
+    """Test the crawling configuration enums."""
+    
+    def test_name_lists_derived_from_enums(self):
+        """Test that the name lists keep their values and order."""
+        from political_crawling_config import POLITICAL_CATEGORIES, RELATIONSHIP_TYPES, PolicyCat, RelType
+        
+        assert RELATIONSHIP_TYPES == [
+            "SPONSORS", "SUPPORTS", "OPPOSES", "MEMBER_OF", "VOTES_FOR",
+            "VOTES_AGAINST", "ATTENDS", "MENTIONS", "RELATED_TO", "PART_OF",
+        ]
+        assert POLITICAL_CATEGORIES[0] == "Domestic Policy"
+        assert POLITICAL_CATEGORIES[-1] == "Tax Policy"
+        assert RELATIONSHIP_TYPES[RelType.MEMBER_OF] == "MEMBER_OF"
+        assert POLITICAL_CATEGORIES[PolicyCat.HEALTHCARE] == "Healthcare Policy"
+
+
+class TestIngestorCaches:
+    """Test the document ingestor's caches and de-duplication."""
+    
+    @pytest.fixture
+    def ingestor(self):
+        """Import the ingestor module when its web reader dependencies are installed."""
+        return pytest.importorskip("political_document_ingestor")
+        
+    def test_url_cache_store_is_atomic(self, ingestor, temp_dir: Path):
+        """Test that stored bodies appear whole and failed stores leave nothing behind."""
+        cache = ingestor.URLCache(temp_dir / "cache")
+        source = temp_dir / "download.html"
+        source.write_bytes(b"<html>budget</html>")
+        
+        cache.store("https://example.gov/a", '"v1"', None, source)
+        etag, last_modified, body_path = cache.get("https://example.gov/a")
+        assert (etag, last_modified) == ('"v1"', None)
+        assert body_path.read_bytes() == b"<html>budget</html>"
+        
+        with pytest.raises(FileNotFoundError):
+            cache.store("https://example.gov/b", None, None, temp_dir / "missing.html")
+        assert [path.name for path in cache.bodies_dir.iterdir()] == [body_path.name]
+        assert cache.get("https://example.gov/b") is None
+        
+    def test_url_cache_evicts_oldest(self, ingestor, temp_dir: Path):
+        """Test that the least recently fetched body is evicted once over max_bytes."""
+        cache = ingestor.URLCache(temp_dir / "cache", max_bytes=10)
+        source = temp_dir / "download.html"
+        source.write_bytes(b"x" * 6)
+        
+        cache.store("https://example.gov/old", None, None, source)
+        with closing(sqlite3.connect(cache.index_file)) as conn, conn:
+            conn.execute("UPDATE urls SET fetched_at = fetched_at - 60")
+        cache.store("https://example.gov/new", None, None, source)
+        
+        assert cache.get("https://example.gov/old") is None
+        assert cache.get("https://example.gov/new") is not None
+        
+    def test_drop_duplicates_across_sources(self, ingestor):
+        """Test that documents differing only in whitespace are kept once."""
+        seen = set()
+        first = ingestor._drop_duplicates(
+            [SimpleNamespace(text="Tax bill passes"), SimpleNamespace(text="Tax  bill\npasses ")], seen
+        )
+        second = ingestor._drop_duplicates(
+            [SimpleNamespace(text="Tax bill passes"), SimpleNamespace(text="Senate adjourns")], seen
+        )
+        
+        assert [doc.text for doc in first] == ["Tax bill passes"]
+        assert [doc.text for doc in second] == ["Senate adjourns"]
+
+
+class TestSemanticCache:
+    """Test the orchestrator's answer cache."""
+    
+    @pytest.fixture
+    def np(self):
+        """Import numpy when it is installed."""
+        return pytest.importorskip("numpy")
+        
+    @pytest.fixture
+    def cache_cls(self, np):
+        """Import the answer cache when the orchestrator's dependencies are installed."""
+        return pytest.importorskip("political_analysis_orchestrator").SemanticCache
+        
+    def test_single_entry_cache_keeps_newest(self, np, cache_cls):
+        """Test that max_entries=1 holds only the latest answer."""
+        cache = cache_cls(embed_model=None, max_entries=1)
+        cache.add("First question", np.array([1.0, 0.0], dtype=np.float32), "first")
+        cache.add("Second question", np.array([0.0, 1.0], dtype=np.float32), "second")
+        
+        assert cache._answers == ["second"]
+        assert cache._vectors.shape == (1, 2)
+        assert list(cache._exact.values()) == ["second"]
+        
+    def test_paraphrase_hits_cache(self, np, cache_cls):
+        """Test that a question with a close embedding returns the cached answer."""
+        embed_model = SimpleNamespace(aget_query_embedding=AsyncMock(return_value=[1.0, 0.0]))
+        cache = cache_cls(embed_model, max_entries=4)
+        
+        answer, vector = asyncio.run(cache.lookup("Who sponsored the bill?"))
+        assert answer is None
+        cache.add("Who sponsored the bill?", vector, "Senator Smith")
+        
+        embed_model.aget_query_embedding.return_value = [0.99, 0.05]
+        answer, _ = asyncio.run(cache.lookup("Which senator sponsored the bill?"))
+        assert answer == "Senator Smith"
+        
\ No newline at end of file
@@ -386,4 +386,84 @@ class TestMCPServerSecurity:
             validated_tool("x" * 101)  # Too long
         
         with pytest.raises(ValueError):
-            validated_tool("")  # Empty
\ No newline at end of file
+            validated_tool("")  # Empty
+
+
+class TestMCPServerLifecycle:
+    """Test MCP server start and stop."""
+    
+    @pytest.mark.asyncio
+    async def test_wait_stopped_returns_after_stop(self):
+        """Test that wait_stopped wakes up when the server is stopped."""
+        from llama_political_manager.mcp_server import MCPServer
+        
+        server = MCPServer()
+        await server.start()
+        
+        waiter = asyncio.create_task(server.wait_stopped())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        
+        await server.stop()
+        await asyncio.wait_for(waiter, timeout=1)
+        
+    @pytest.mark.asyncio
+    async def test_wait_stopped_when_not_running(self):
+        """Test that wait_stopped does not block on a server that never started."""
+        from llama_political_manager.mcp_server import MCPServer
+        
+        await asyncio.wait_for(MCPServer().wait_stopped(), timeout=1)
+
+
+class TestPoliticalDocumentMCPTools:
+    """Test political document MCP tools."""
+    
+    @pytest.mark.asyncio
+    async def test_analysis_uses_processor_keywords(self):
+        """Test that content analysis covers every policy area of the document processor."""
+        from llama_political_manager.document_processor import DocumentProcessor
+        from llama_political_manager.mcp_server import PoliticalDocumentMCPServer
+        
+        processor = DocumentProcessor()
+        server = PoliticalDocumentMCPServer(document_processor=processor)
+        
+        result = await server.handle_tool_call(
+            "analyze_political_content",
+            {"text": "Healthcare, medical insurance and health costs. Border and visa rules."}
+        )
+        
+        assert set(result["analysis"]) == set(processor.political_keywords)
+        assert result["analysis"]["healthcare"] == {"mentions": 4, "relevance": "high"}
+        assert result["analysis"]["immigration"] == {"mentions": 2, "relevance": "medium"}
+        assert result["primary_topics"] == ["healthcare"]
+        
+    @pytest.mark.asyncio
+    async def test_index_documents_in_parallel(self, temp_dir):
+        """Test that indexing several files keeps input order and reports missing ones."""
+        from llama_political_manager.mcp_server import PoliticalDocumentMCPServer
+        
+        paths = []
+        for i in range(5):
+            doc = temp_dir / f"doc_{i}.txt"
+            doc.write_text("policy " * (i + 1) + "a an")
+            paths.append(str(doc))
+        paths.insert(2, str(temp_dir / "missing.txt"))
+        
+        result = await PoliticalDocumentMCPServer().handle_tool_call(
+            "index_documents", {"document_paths": paths}
+        )
+        
+        assert [doc["path"] for doc in result["documents"]] == paths
+        assert result["total_indexed"] == 5
+        assert result["documents"][2] == {"path": paths[2], "indexed": False, "error": "File not found"}
+        assert [doc["keywords"] for doc in result["documents"] if doc["indexed"]] == [1, 2, 3, 4, 5]
+    
+    def test_tool_access_rejects_non_string_keys(self):
+        """Missing or non-string API keys are refused rather than raising."""
+        from llama_political_manager.mcp_server import PoliticalDocumentMCPServer
+        
+        server = PoliticalDocumentMCPServer()
+        assert server.validate_tool_access("search_documents", "valid-api-key")
+        assert not server.validate_tool_access("search_documents", "wrong-key")
+        for api_key in (None, "", 12345, b"valid-api-key"):
+            assert not server.validate_tool_access("search_documents", api_key)
@@ -635,4 +635,104 @@ class TestWebInterfaceErrorHandling:
         
         # Should handle large documents gracefully
         assert response.status_code == 200
-        assert response.data["success"] is True
\ No newline at end of file
+        assert response.data["success"] is True
+
+
+class TestRequestPooling:
+    """Test request object pooling."""
+    
+    def test_reset_overwrites_previous_request(self):
+        """Test that reset clears state left by an earlier request."""
+        from llama_political_manager.web_interface import MockRequest
+        
+        request = MockRequest("POST", "/api/search", json_data={"query": "budget"})
+        request.headers["X-Test"] = "1"
+        
+        request.reset("GET", "/api/health")
+        assert request.method == "GET"
+        assert request.path == "/api/health"
+        assert request.get_json() == {}
+        assert request.headers == {}
+        
+    def test_borrow_reuses_released_request(self):
+        """Test that a released request is handed out again."""
+        from llama_political_manager.web_interface import borrow_request, release_request
+        
+        first = borrow_request("GET", "/")
+        release_request(first)
+        
+        second = borrow_request("GET", "/api/config", query_params={"type": "database"})
+        assert second is first
+        assert second.path == "/api/config"
+        assert second.query_params == {"type": "database"}
+
+
+class TestRouteResponses:
+    """Test web interface route responses."""
+    
+    def test_route_added_after_setup_is_dispatched(self):
+        """Routes registered after setup are dispatched too."""
+        from llama_political_manager.web_interface import WebInterface, MockRequest
+        
+        web_app = WebInterface()
+        
+        @web_app.app.route("/api/ping")
+        def ping(request):
+            return {"pong": True}
+        
+        response = web_app.app.handle_request(MockRequest("GET", "/api/ping"))
+        assert response.status_code == 200
+        assert response.data == {"pong": True}
+        assert web_app.app.handle_request(MockRequest("GET", "/missing")).status_code == 404
+    
+    def test_not_found_responses_are_independent(self):
+        """Test that each unmatched request gets its own 404 response."""
+        from llama_political_manager.web_interface import WebInterface, MockRequest
+        
+        web_app = WebInterface()
+        first = web_app.app.handle_request(MockRequest("GET", "/missing"))
+        first.json()["error"] = "changed"
+        second = web_app.app.handle_request(MockRequest("GET", "/missing"))
+        assert second.status_code == 404
+        assert second.json() == {"error": "Not found"}
+    
+    def test_static_routes_are_independent(self):
+        """Editing one static page response leaves later ones intact."""
+        from llama_political_manager.web_interface import WebInterface, MockRequest
+        
+        web_app = WebInterface()
+        first = web_app.app.handle_request(MockRequest("GET", "/"))
+        first.data["features"].clear()
+        second = WebInterface().app.handle_request(MockRequest("GET", "/"))
+        assert second.data["title"] == "LlamaIndex Political Document Manager"
+        assert len(second.data["features"]) == 5
+    
+    def test_list_documents_search_filters_titles(self):
+        """Test that the document listing keeps only titles matching the search."""
+        from llama_political_manager.web_interface import WebInterface, MockRequest
+        
+        web_app = WebInterface()
+        request = MockRequest("GET", "/api/documents",
+                              query_params={"limit": "20", "offset": "5", "search": "Document 1"})
+        response = web_app.app.handle_request(request)
+        
+        assert [doc["id"] for doc in response.data["documents"]] == [10, 11, 12, 13, 14, 15, 16, 17, 18, 19]
+        assert response.data["documents"][0]["title"] == "Political Document 10"
+        
+        request = MockRequest("GET", "/api/documents", query_params={"search": None})
+        assert len(web_app.app.handle_request(request).data["documents"]) == 10
+    
+    def test_health_check_reports_current_time(self):
+        """Test that the health check carries a UTC ISO-8601 timestamp."""
+        import re
+        from llama_political_manager.web_interface import WebInterface, MockRequest
+        
+        web_app = WebInterface()
+        response = web_app.app.handle_request(MockRequest("GET", "/api/health"))
+        assert response.data["status"] == "healthy"
+        assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ", response.data["timestamp"])
+        
+        response.data["components"]["database"] = "disconnected"
+        again = web_app.app.handle_request(MockRequest("GET", "/api/health"))
+        assert again is not response
+        assert again.data["components"]["database"] == "connected"